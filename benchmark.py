@@ -0,0 +1,305 @@
+"""Benchmark every page, tab and dropdown value of the dashboard.
+
+    python benchmark.py --scales data,1M,10M --out bench.json
+    python benchmark.py --compare before.json after.json
+
+Each scale runs in its own process, which drives ``app.py`` headlessly with
+Streamlit's ``AppTest``. ``data`` is the repo's own dataset; a row count
+such as ``1M`` is a synthetic dataset from ``dashboard.synthetic``, written
+once to ``dataSet/.bench/<scale>/`` and run from there so the app's
+relative ``dataSet/`` paths (CSV, Parquet copy, caches) all point at it.
+
+The run visits each page, opens each of its tabs, and sets every
+selectbox and select slider it draws to each of its values in turn
+(restoring the default afterwards). Every interaction records:
+
+* ``first_ms`` -- the run that first shows that state, i.e. with cold caches;
+* ``rerun_ms`` -- the median of ``--repeat`` further runs of the same state;
+* ``peak_rss_mib`` -- peak resident memory of the process during the first run;
+* ``figure_bytes`` -- total size of the Plotly figure specs sent to the browser.
+
+Results are written as JSON, together with the commit and library versions;
+``--compare`` lines up two result files by scale and interaction.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(ROOT, "app.py")
+BENCH_DIR = os.path.join(ROOT, "dataSet", ".bench")
+
+# Path of the cleaned CSV relative to the directory the app runs from.
+CLEANED_CSV = os.path.join("dataSet", "cleaned_airlines_flights_data.csv")
+
+
+def _rss_mib(field):
+    # VmRSS / VmHWM of this process from /proc, in MiB (None outside Linux)
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss():
+    # Start a new VmHWM measurement (Linux only; ignored elsewhere)
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _figure_bytes(at):
+    charts = at.get("plotly_chart")
+    return len(charts), sum(len(chart.proto.spec.encode()) for chart in charts)
+
+
+class _Runner:
+    # Runs an AppTest and records one result per interaction
+
+    def __init__(self, at, repeat):
+        self.at = at
+        self.repeat = repeat
+        self.results = []
+        self.tab = None     # (state key, label) of the tab every run must show
+
+    def rerun(self):
+        # AppTest does not keep a tab open from one run to the next, so the
+        # tab is selected again before each run, and checked to be the open one
+        if self.tab is not None:
+            self.at.session_state[self.tab[0]] = self.tab[1]
+        self.at.run()
+        if self.tab is not None:
+            open_tabs = [tab.label for tab in self.at.tabs if tab.children]
+            if open_tabs != [self.tab[1]]:
+                raise RuntimeError(f"expected tab {self.tab[1]!r} to be open, found {open_tabs}")
+
+    def run(self, **where):
+        _reset_peak_rss()
+        start = time.perf_counter()
+        self.rerun()
+        first = time.perf_counter() - start
+        peak = _rss_mib("VmHWM")
+        errors = [e.message for e in self.at.exception]
+
+        reruns = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            self.rerun()
+            reruns.append(time.perf_counter() - start)
+
+        charts, nbytes = _figure_bytes(self.at)
+        result = dict(
+            where,
+            first_ms=round(first * 1000, 1),
+            rerun_ms=round(statistics.median(reruns) * 1000, 1) if reruns else None,
+            peak_rss_mib=peak,
+            rss_mib=_rss_mib("VmRSS"),
+            charts=charts,
+            figure_bytes=nbytes,
+        )
+        if errors:
+            result["errors"] = errors
+        self.results.append(result)
+        print("  " + " | ".join(str(v) for v in where.values()) + f": {result['first_ms']} ms", flush=True)
+        return result
+
+
+def _walk_widgets(runner, page, tab):
+    # Every value of every selectbox and select slider on the current view
+    at = runner.at
+    widgets = [("selectbox", w) for w in at.selectbox] + [("select_slider", w) for w in at.select_slider]
+    for kind, widget in widgets:
+        ident = widget.key or widget.label
+        default = widget.value
+        for option in widget.options:
+            if option == str(default):
+                continue
+            _find(at, kind, ident).set_value(_option_value(widget, option))
+            runner.run(page=page, tab=tab, widget=ident, value=option)
+        _find(at, kind, ident).set_value(default)
+        runner.rerun()
+
+
+def _find(at, kind, ident):
+    # Widgets are looked up again after every run; the old handles are stale
+    for widget in getattr(at, kind):
+        if (widget.key or widget.label) == ident:
+            return widget
+    raise LookupError(f"{kind} {ident!r} is no longer drawn")
+
+
+def _option_value(widget, option):
+    # AppTest lists options as strings; select sliders take the typed value
+    if isinstance(widget.value, int) and not isinstance(widget.value, bool):
+        return int(option)
+    return option
+
+
+def run_scale(scale, repeat):
+    """Benchmark the app on the dataset under the current directory."""
+    from streamlit.testing.v1 import AppTest
+
+    from views import PAGES
+
+    at = AppTest.from_file(APP, default_timeout=3600)
+    runner = _Runner(at, repeat)
+    startup = runner.run(page="(start)", tab=None, widget=None, value=None)
+
+    for page, module in PAGES.items():
+        runner.tab = None
+        at.sidebar.radio[0].set_value(page)
+        runner.run(page=page, tab=None, widget=None, value=None)
+        tabs = [tab.label for tab in at.tabs]
+        if not tabs:
+            _walk_widgets(runner, page, None)
+            continue
+        for label in tabs:
+            runner.tab = (f"{module}_tabs", label)
+            runner.run(page=page, tab=label, widget=None, value=None)
+            _walk_widgets(runner, page, label)
+
+    return {
+        "scale": scale,
+        "startup_ms": startup["first_ms"],
+        "interactions": runner.results,
+    }
+
+
+def prepare_scale(scale, seed=0):
+    """Directory to run ``scale`` from, generating its dataset on first use."""
+    if scale == "data":
+        return ROOT
+    from dashboard.synthetic import parse_rows, write_synthetic
+
+    workdir = os.path.join(BENCH_DIR, f"{scale}-seed{seed}")
+    csv_path = os.path.join(workdir, CLEANED_CSV)
+    if not os.path.exists(csv_path):
+        print(f"Generating {scale} rows into {csv_path}", flush=True)
+        write_synthetic(csv_path, parse_rows(scale), seed=seed)
+    return workdir
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _versions():
+    import numpy
+    import pandas
+    import plotly
+    import streamlit
+
+    return {
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "plotly": plotly.__version__,
+    }
+
+
+def benchmark(scales, repeat, out):
+    """Run every scale in its own process and write the combined results to ``out``."""
+    results = {
+        "commit": _commit(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "versions": _versions(),
+        "scales": [],
+    }
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    for scale in scales:
+        workdir = prepare_scale(scale)
+        print(f"Scale {scale} ({workdir})", flush=True)
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            scale_out = f.name
+        try:
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--worker", scale,
+                 "--repeat", str(repeat), "--out", scale_out],
+                cwd=workdir, env=env, check=True,
+            )
+            with open(scale_out) as f:
+                results["scales"].append(json.load(f))
+        finally:
+            os.remove(scale_out)
+
+    with open(out, "w") as f:
+        json.dump(results, f, indent=1)
+    print(f"Wrote {out}")
+
+
+def _key(item):
+    return (item["page"], item["tab"], item["widget"], item["value"])
+
+
+def compare(before_path, after_path):
+    """Print first-run and rerun times of two result files side by side."""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"before {before['commit']}  after {after['commit']}")
+    old_scales = {s["scale"]: s for s in before["scales"]}
+    for scale in after["scales"]:
+        old = old_scales.get(scale["scale"])
+        if old is None:
+            continue
+        print(f"\nScale {scale['scale']}: startup {old['startup_ms']} -> {scale['startup_ms']} ms")
+        old_items = {_key(item): item for item in old["interactions"]}
+        for item in scale["interactions"]:
+            prev = old_items.get(_key(item))
+            if prev is None:
+                continue
+            label = " | ".join(str(v) for v in _key(item) if v is not None)
+            print(
+                f"  {label}: first {prev['first_ms']} -> {item['first_ms']} ms, "
+                f"rerun {prev['rerun_ms']} -> {item['rerun_ms']} ms"
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark every page, tab and dropdown value of the dashboard."
+    )
+    parser.add_argument(
+        "--scales", default="data", help="comma-separated: 'data' and/or row counts such as 1M,10M"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="reruns timed per interaction")
+    parser.add_argument("--out", default="benchmark.json", help="JSON file to write")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two result files instead"
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+    elif args.worker:
+        result = run_scale(args.worker, args.repeat)
+        with open(args.out, "w") as f:
+            json.dump(result, f)
+    else:
+        benchmark(args.scales.split(","), args.repeat, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Data and chart helpers behind the Streamlit dashboard in ``app.py``."""
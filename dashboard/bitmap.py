@@ -0,0 +1,92 @@
+"""Bitmap index over the low-cardinality columns used by the page filters.
+
+For every value of every ``INDEXED_COLUMNS`` column, ``BitmapIndex`` keeps a
+packed bitmap with one bit per row (bit ``i`` set if row ``i`` holds the
+value). A filter is then a bitwise OR over the wanted values of a column and
+a bitwise AND across columns, touching ``n_rows / 8`` bytes per bitmap
+instead of comparing every row.
+"""
+import numpy as np
+import pandas as pd
+
+# Columns indexed at load; each has at most a few dozen distinct values.
+INDEXED_COLUMNS = [
+    "airline",
+    "class",
+    "stops",
+    "source_city",
+    "destination_city",
+    "departure_time",
+    "arrival_time",
+]
+
+
+def _wanted(values):
+    # A single label or any iterable of labels, as a list.
+    if np.ndim(values) == 0:
+        return [values]
+    return list(values)
+
+
+class BitmapIndex:
+    """Packed per-value row bitmaps of ``INDEXED_COLUMNS``."""
+
+    def __init__(self, frame, columns=INDEXED_COLUMNS):
+        self.n_rows = len(frame)
+        self.bitmaps = {}
+        for col in columns:
+            series = frame[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                values = series.cat.categories.to_numpy()
+                codes = series.cat.codes.to_numpy()
+            else:
+                values, codes = np.unique(series.to_numpy(), return_inverse=True)
+            self.bitmaps[col] = {
+                value: np.packbits(codes == code, bitorder="little")
+                for code, value in enumerate(values.tolist())
+            }
+        self._empty = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        self._full = np.packbits(np.ones(self.n_rows, dtype=bool), bitorder="little")
+
+    def __contains__(self, column):
+        return column in self.bitmaps
+
+    def values(self, column):
+        """Every label of ``column``, in index order."""
+        return list(self.bitmaps[column])
+
+    def column(self, column, values):
+        """Bitmap of the rows whose ``column`` is any of ``values`` (OR).
+
+        ``values`` is one label or a list of labels; labels that never occur
+        select no rows.
+        """
+        bitmaps = self.bitmaps[column]
+        result = self._empty
+        for value in _wanted(values):
+            if value in bitmaps:
+                result = result | bitmaps[value]
+        return result
+
+    def select(self, **where):
+        """Bitmap of the rows matching every ``column=values`` given (AND).
+
+        A value of ``None`` leaves that column unfiltered.
+        """
+        result = self._full
+        for col, values in where.items():
+            if values is not None:
+                result = result & self.column(col, values)
+        return result
+
+    def to_mask(self, bitmap):
+        """Boolean row mask of a packed bitmap."""
+        return np.unpackbits(bitmap, count=self.n_rows, bitorder="little").view(bool)
+
+    def count(self, bitmap):
+        """Number of rows set in ``bitmap``."""
+        return int(np.bitwise_count(bitmap).sum())
+
+    @property
+    def nbytes(self):
+        return sum(b.nbytes for bitmaps in self.bitmaps.values() for b in bitmaps.values())
@@ -0,0 +1,103 @@
+"""Plotly figure builders that keep the payload sent to the browser small."""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Above this many rows a scatter plot is replaced by a server-side density
+# image; below it the real points (with hover details) are sent.
+SCATTER_POINT_LIMIT = 5000
+
+# Number of price bins of the density image (days_left gets one bin per day).
+DENSITY_Y_BINS = 120
+
+
+def density_heatmap(frame, x, y, title):
+    """Bin ``frame[x]`` × ``frame[y]`` on the server and draw the counts.
+
+    ``x`` is expected to hold integers (one bin per value, e.g. days_left).
+    The figure only carries the bin counts, never the individual rows.
+    """
+    xs = frame[x].to_numpy()
+    ys = frame[y].to_numpy()
+
+    x_edges = np.arange(xs.min() - 0.5, xs.max() + 1.5)
+    y_edges = np.linspace(ys.min(), ys.max(), DENSITY_Y_BINS + 1)
+    counts, _, _ = np.histogram2d(xs, ys, bins=[x_edges, y_edges])
+
+    z = counts.T
+    z[z == 0] = np.nan   # leave empty cells transparent
+
+    fig = go.Figure(go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        z=z,
+        colorscale="Viridis",
+        colorbar=dict(title="Flights"),
+        hovertemplate=f"{x}: %{{x}}<br>{y}: %{{y:,.0f}}<br>Flights: %{{z}}<extra></extra>",
+    ))
+    fig.update_layout(title=f"{title} — density of {len(frame):,} flights")
+    return fig
+
+
+def scatter_or_density(frame, x, y, title, marker=None, limit=SCATTER_POINT_LIMIT, **scatter_args):
+    """A ``px.scatter`` of ``frame``, or a density image if it has too many rows.
+
+    ``scatter_args`` (``color``, ``hover_data``, ``opacity``, ...) and
+    ``marker`` only apply to the scatter, since the density image has no
+    per-point markers.
+    """
+    if len(frame) > limit:
+        return density_heatmap(frame, x, y, title)
+
+    fig = px.scatter(frame, x=x, y=y, title=title, **scatter_args)
+    if marker is not None:
+        fig.update_traces(marker=marker)
+    return fig
+
+
+def box_figure(stats, x, title, colors=px.colors.qualitative.Plotly):
+    """Box plot drawn from precomputed statistics (see ``distributions.box_stats``).
+
+    Each box is one trace built from its quartiles, whiskers and mean; the
+    capped outliers are drawn as a marker trace next to it.
+    """
+    fig = go.Figure()
+    for i, row in enumerate(stats.itertuples(index=False)):
+        label = getattr(row, x)
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Box(
+            x=[label],
+            q1=[row.q1],
+            median=[row.median],
+            q3=[row.q3],
+            lowerfence=[row.lowerfence],
+            upperfence=[row.upperfence],
+            mean=[row.mean],
+            name=str(label),
+            marker_color=color,
+            boxpoints=False,
+        ))
+        if len(row.outliers):
+            fig.add_trace(go.Scatter(
+                x=[label] * len(row.outliers),
+                y=row.outliers,
+                mode="markers",
+                name=str(label),
+                marker=dict(color=color, size=4, opacity=0.5),
+                hovertemplate="Price: %{y:,.0f}<extra></extra>",
+            ))
+    fig.update_layout(title=title)
+    return fig
+
+
+def histogram_figure(counts, edges, x, title, color, opacity=0.85):
+    """Histogram drawn from precomputed bin counts, styled like ``px.histogram``."""
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color,
+        opacity=opacity,
+    ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title="count", bargap=0)
+    return fig
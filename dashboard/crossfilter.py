@@ -0,0 +1,198 @@
+"""Incremental cross-filtering of the flights rows for linked charts.
+
+Selecting points on one chart filters the rows behind the other charts of a
+page. ``Crossfilter`` keeps, per filtered dimension, the set of positions it
+selects in that dimension's sorted index (see ``FlightDataset.sorted_index``)
+and, while any filter is set, one bit per row and dimension marking the rows
+it rejects. Changing a filter only visits the rows that enter or leave it --
+the positions between the old and new selection's boundaries -- and adds or
+subtracts them from each ``Group``'s per-key count and price sum.
+
+Everything per row (prices, sort orders, each group's cell codes) is shared
+through the dataset; a crossfilter itself holds the row bits, one byte per
+row and only while filtered, and per-cell sums for at most ``MAX_GROUPS``
+groups.
+
+As in crossfilter.js, a group ignores the filter on its own dimension, so
+the chart a selection is made on keeps showing every bar or point. On a
+``FlightSelection`` the rows outside the selection carry a bit of their own
+that no group ignores.
+"""
+import numpy as np
+import pandas as pd
+
+from dashboard import timing
+
+# Groups kept per crossfilter; the least recently created is dropped first.
+MAX_GROUPS = 8
+
+# Row bit of the rows outside the dataset's selection.
+_OUTSIDE = np.uint8(1 << 7)
+
+
+class Group:
+    """Count and sum of price per key of ``by``, over the rows passing the filters."""
+
+    def __init__(self, by, codes, labels, dimension=None):
+        self.by = by
+        self.dimension = dimension
+        self.labels = labels
+        self.shape = tuple(len(labels[col]) for col in by)
+        self._codes = codes
+        size = int(np.prod(self.shape))
+        self.count = np.zeros(size)
+        self.total = np.zeros(size)
+
+    def fill(self, rows, values):
+        """Add ``rows`` (an index array or slice) to the empty reductions."""
+        codes = self._codes[rows]
+        self.count += np.bincount(codes, minlength=len(self.count))
+        self.total += np.bincount(codes, weights=values[rows], minlength=len(self.total))
+
+    def add(self, rows, sign, values):
+        """Add (``sign`` +1) or remove (-1) ``rows`` from the reductions."""
+        codes = self._codes[rows]
+        self.count += np.bincount(codes, weights=sign, minlength=len(self.count))
+        self.total += np.bincount(codes, weights=sign * values[rows], minlength=len(self.total))
+
+    def table(self):
+        """One row per non-empty key with the ``by`` columns, ``count``, ``sum`` and ``mean``.
+
+        Same layout and order as ``PriceCube.rollup`` (without std/min/max).
+        """
+        count = self.count.reshape(self.shape)
+        total = self.total.reshape(self.shape)
+        cells = np.nonzero(count > 0.5)
+        result = pd.DataFrame(
+            {col: self.labels[col][idx] for col, idx in zip(self.by, cells)}
+        )
+        result["count"] = np.rint(count[cells]).astype(np.int64)
+        result["sum"] = total[cells]
+        result["mean"] = total[cells] / count[cells]
+        return result
+
+
+class Crossfilter:
+    """Filters on up to seven dimensions of a dataset and the groups they feed.
+
+    ``dataset`` is a ``FlightDataset`` or a ``FlightSelection``; rows are
+    those of its base dataset, and masks are over all of them.
+    ``dimensions`` are columns of the dataset; each may be filtered with
+    ``filter`` (a set of values) or ``filter_range`` (an inclusive range).
+    """
+
+    def __init__(self, dataset, dimensions, value="price"):
+        if len(dimensions) > 7:
+            raise ValueError("Crossfilter supports at most 7 dimensions")
+        self.dataset = dataset
+        self.dimensions = list(dimensions)
+        self._base = dataset.base
+        self._frame = self._base.frame
+        self._values = self._frame[value].to_numpy()     # a view of the shared column
+        self._n = len(self._frame)
+        # Bit i of a row is set while dimension i's filter rejects it, and
+        # _OUTSIDE while the row is not in the dataset's selection; None
+        # while no bit is set anywhere.
+        selected = dataset.row_mask
+        self._restricted = selected is not None
+        self._bits = np.where(selected, 0, _OUTSIDE).astype(np.uint8) if self._restricted else None
+        # Sorted-index positions each filter keeps, as [start, end) pairs.
+        self._selected = {dim: np.array([0, self._n]) for dim in self.dimensions}
+        self._groups = {}
+
+    def _bit(self, dim):
+        return np.uint8(0) if dim is None else np.uint8(1 << self.dimensions.index(dim))
+
+    def _keys(self, dim, values):
+        # Sort keys of the labels in ``values`` (category codes for categoricals).
+        col = self._frame[dim]
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            codes = col.cat.categories.get_indexer(list(values))
+            return np.sort(codes[codes >= 0])
+        return np.sort(np.asarray(list(values)))
+
+    def filter(self, dim, values=None):
+        """Keep the rows whose ``dim`` is one of ``values``; ``None`` clears the filter."""
+        if values is None:
+            self._update(dim, np.array([0, self._n]))
+            return
+        _, keys = self._base.sorted_index(dim)
+        wanted = self._keys(dim, values)
+        starts = np.searchsorted(keys, wanted, side="left")
+        ends = np.searchsorted(keys, wanted, side="right")
+        self._update(dim, np.column_stack([starts, ends]).ravel())
+
+    def filter_range(self, dim, low, high):
+        """Keep the rows with ``low <= dim <= high``."""
+        _, keys = self._base.sorted_index(dim)
+        self._update(dim, np.array([
+            np.searchsorted(keys, low, side="left"),
+            np.searchsorted(keys, high, side="right"),
+        ]))
+
+    def _update(self, dim, selected):
+        old = self._selected[dim]
+        if np.array_equal(old, selected):
+            return
+        self._selected[dim] = selected
+
+        # The positions whose membership flips lie between consecutive
+        # boundaries of the two selections taken together (their XOR).
+        bounds = np.sort(np.concatenate([old, selected]))
+        starts, ends = bounds[0::2], bounds[1::2]
+        keep = ends > starts
+        starts, ends = starts[keep], ends[keep]
+        if len(starts) == 0:
+            return
+        if self._bits is None:
+            self._bits = np.zeros(self._n, dtype=np.uint8)
+        entering = np.searchsorted(selected, starts, side="right") % 2 == 1
+
+        order, _ = self._base.sorted_index(dim)
+        rows = np.concatenate([order[s:e] for s, e in zip(starts, ends)])
+        sign = np.repeat(np.where(entering, 1.0, -1.0), ends - starts)
+
+        bit = self._bit(dim)
+        self._bits[rows] = np.where(sign > 0, self._bits[rows] & ~bit, self._bits[rows] | bit)
+
+        for group in self._groups.values():
+            if group.dimension == dim:
+                continue
+            others = ~(bit | self._bit(group.dimension))
+            live = (self._bits[rows] & others) == 0
+            group.add(rows[live], sign[live], self._values)
+
+        if not self._restricted and not any(self.is_filtered(d) for d in self.dimensions):
+            self._bits = None
+
+    def mask(self, exclude=None):
+        """Boolean mask of the rows passing every filter except ``exclude``'s.
+
+        None when no row is filtered out, i.e. for every row.
+        """
+        if self._bits is None:
+            return None
+        return (self._bits & ~self._bit(exclude)) == 0
+
+    def is_filtered(self, dim):
+        """Whether ``dim`` currently has a filter."""
+        return not np.array_equal(self._selected[dim], [0, self._n])
+
+    def group(self, by, days_bin=None, dimension=None):
+        """The ``Group`` of ``by`` columns, created (in one pass) on first use.
+
+        ``by`` may include ``"days_bin"`` with ``days_bin`` giving the bin
+        width, binned like ``PriceCube.rollup``. ``dimension`` is the
+        dimension whose filter the group ignores.
+        """
+        key = (tuple(by), days_bin, dimension)
+        if key not in self._groups:
+            with timing.span("crossfilter.group", by=",".join(by)):
+                codes, labels = self._base.group_codes(by, days_bin)
+                group = Group(list(by), codes, labels, dimension)
+                mask = self.mask(exclude=dimension)
+                group.fill(slice(None) if mask is None else np.flatnonzero(mask), self._values)
+                if len(self._groups) >= MAX_GROUPS:
+                    self._groups.pop(next(iter(self._groups)))
+                self._groups[key] = group
+        return self._groups[key]
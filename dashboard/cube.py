@@ -0,0 +1,202 @@
+"""Aggregate cube of ticket prices.
+
+``PriceCube`` holds the sufficient statistics of ``price`` (count, sum, sum
+of squares, min and max) for every combination of ``CUBE_DIMS``, stored as
+dense NumPy arrays. Charts that show means or counts per group are answered
+by ``PriceCube.rollup``, which only touches the cube cells, never the rows.
+
+Count, sum and sum of squares are also kept as running totals along the
+days_left axis, so grouping days into bins of any width costs two lookups
+per bin instead of a pass over every day.
+"""
+import numpy as np
+import pandas as pd
+
+from dashboard import timing
+
+# Dimensions of the cube, in axis order. ``days_left`` is always the last
+# axis and is indexed directly by its value (0 .. max days_left).
+CUBE_DIMS = ["airline", "class", "stops", "source_city", "destination_city", "days_left"]
+
+# Pseudo-dimension produced by grouping the days_left axis into fixed-width bins.
+DAYS_BIN = "days_bin"
+
+
+def days_bin_labels(n_bins, width):
+    """Labels matching ``pd.cut(days_left, np.arange(0, max + width, width))``."""
+    return [f"({i * width}, {(i + 1) * width}]" for i in range(n_bins)]
+
+
+def days_bin_days(label):
+    """First and last day (inclusive) covered by a ``days_bin_labels`` label."""
+    low, high = label.strip("(]").split(", ")
+    return int(low) + 1, int(high)
+
+
+class PriceCube:
+    """Dense count/sum/sum-of-squares/min/max of price over ``CUBE_DIMS``."""
+
+    def __init__(self, labels, count, total, total_sq, minimum, maximum):
+        self.labels = labels
+        self.count = count
+        self.total = total
+        self.total_sq = total_sq
+        self.minimum = minimum
+        self.maximum = maximum
+
+        # prefix_*[..., d] is the total over days_left <= d.
+        self.prefix_count = np.cumsum(count, axis=-1)
+        self.prefix_total = np.cumsum(total, axis=-1)
+        self.prefix_total_sq = np.cumsum(total_sq, axis=-1)
+
+    @classmethod
+    def from_frame(cls, df, mask=None):
+        """Build the cube from the flights frame in a single pass over the rows.
+
+        With a boolean ``mask``, only the rows it selects are counted; just
+        their codes and prices are gathered, not whole rows.
+        """
+        rows = None if mask is None else np.flatnonzero(mask)
+
+        def column(values):
+            # The selected values, gathered before any widening
+            return values if rows is None else values.take(rows)
+
+        labels = {}
+        codes = []
+        for dim in CUBE_DIMS:
+            col = df[dim]
+            if dim == "days_left":
+                days = column(col.to_numpy()).astype(np.int64)
+                labels[dim] = np.arange(int(days.max()) + 1)
+                codes.append(days)
+            elif isinstance(col.dtype, pd.CategoricalDtype):
+                labels[dim] = col.cat.categories.to_numpy()
+                codes.append(column(col.cat.codes.to_numpy()).astype(np.int64))
+            else:
+                labels[dim], inverse = np.unique(column(col.to_numpy()), return_inverse=True)
+                codes.append(inverse.astype(np.int64))
+
+        shape = tuple(len(labels[dim]) for dim in CUBE_DIMS)
+        size = int(np.prod(shape))
+        cell = np.ravel_multi_index(codes, shape)
+        price = column(df["price"].to_numpy()).astype(np.float64)
+
+        count = np.bincount(cell, minlength=size)
+        total = np.bincount(cell, weights=price, minlength=size)
+        total_sq = np.bincount(cell, weights=price * price, minlength=size)
+
+        extremes = pd.Series(price).groupby(cell).agg(["min", "max"])
+        minimum = np.full(size, np.inf)
+        maximum = np.full(size, -np.inf)
+        minimum[extremes.index] = extremes["min"].to_numpy()
+        maximum[extremes.index] = extremes["max"].to_numpy()
+
+        return cls(
+            labels,
+            count.reshape(shape),
+            total.reshape(shape),
+            total_sq.reshape(shape),
+            minimum.reshape(shape),
+            maximum.reshape(shape),
+        )
+
+    def values(self, dim):
+        """Labels present along ``dim`` (only those with at least one flight)."""
+        axis = CUBE_DIMS.index(dim)
+        other = tuple(i for i in range(len(CUBE_DIMS)) if i != axis)
+        present = self.count.sum(axis=other) > 0
+        return list(self.labels[dim][present])
+
+    def restrict(self, where):
+        """The cube of the rows matching ``where``, as a new ``PriceCube``.
+
+        ``where`` maps a dimension to a label or list of labels; only those
+        cells are kept, so this costs O(cells) and no pass over the rows.
+        """
+        arrays, labels = self._select(
+            where, [self.count, self.total, self.total_sq, self.minimum, self.maximum]
+        )
+        return PriceCube(labels, *arrays)
+
+    def _select(self, where, arrays):
+        # Restrict every axis named in ``where`` to the requested labels.
+        labels = dict(self.labels)
+        for dim, wanted in (where or {}).items():
+            axis = CUBE_DIMS.index(dim)
+            if np.ndim(wanted) == 0:
+                wanted = [wanted]
+            index = np.flatnonzero(np.isin(self.labels[dim], list(wanted)))
+            arrays = [np.take(a, index, axis=axis) for a in arrays]
+            labels[dim] = self.labels[dim][index]
+        return arrays, labels
+
+    @timing.timed("cube.rollup")
+    def rollup(self, by, where=None, days_bin=None):
+        """Aggregate the cube down to the dimensions in ``by``.
+
+        ``where`` maps a dimension to a label or list of labels to keep.
+        ``by`` may include ``"days_bin"`` when ``days_bin`` gives a bin width
+        in days; bins follow ``pd.cut`` with edges ``0, width, 2*width, ...``
+        and are read off the running totals, so any width costs O(bins).
+
+        Returns one row per non-empty group with the ``by`` columns followed by
+        ``count``, ``sum``, ``mean``, ``std``, ``min`` and ``max``, sorted by
+        the ``by`` columns in order.
+        """
+        dims = list(CUBE_DIMS)
+
+        if days_bin is None:
+            (count, total, total_sq, minimum, maximum), labels = self._select(
+                where, [self.count, self.total, self.total_sq, self.minimum, self.maximum]
+            )
+        else:
+            (count, total, total_sq, minimum, maximum), labels = self._select(
+                where,
+                [self.prefix_count, self.prefix_total, self.prefix_total_sq,
+                 self.minimum, self.maximum],
+            )
+            # Bin i holds days i*width+1 .. (i+1)*width: the difference of the
+            # running totals at its two edges. Day 0 falls outside every bin.
+            n_days = count.shape[-1]
+            n_bins = max(1, -(-(n_days - 1) // days_bin))
+            edges = np.minimum(np.arange(n_bins + 1) * days_bin, n_days - 1)
+
+            count = np.diff(count[..., edges], axis=-1)
+            total = np.diff(total[..., edges], axis=-1)
+            total_sq = np.diff(total_sq[..., edges], axis=-1)
+            # Extremes have no running form; reduce them per bin instead.
+            minimum = np.minimum.reduceat(minimum[..., 1:], edges[:-1], axis=-1)
+            maximum = np.maximum.reduceat(maximum[..., 1:], edges[:-1], axis=-1)
+            dims[-1] = DAYS_BIN
+            labels[DAYS_BIN] = np.array(days_bin_labels(n_bins, days_bin))
+
+        # Sum out every axis not in ``by``, then order the rest as in ``by``.
+        drop = tuple(i for i, dim in enumerate(dims) if dim not in by)
+        kept = [dim for dim in dims if dim in by]
+        order = [kept.index(dim) for dim in by]
+
+        def reduce(a, func):
+            return np.transpose(func(a, axis=drop), order)
+
+        count = reduce(count, np.sum)
+        total = reduce(total, np.sum)
+        total_sq = reduce(total_sq, np.sum)
+        minimum = reduce(minimum, np.min)
+        maximum = reduce(maximum, np.max)
+
+        cells = np.nonzero(count > 0)
+        n = count[cells]
+        mean = total[cells] / n
+        # Sample standard deviation, matching pandas' default ddof=1.
+        var = (total_sq[cells] - n * mean * mean) / np.maximum(n - 1, 1)
+        result = pd.DataFrame(
+            {dim: labels[dim][idx] for dim, idx in zip(by, cells)}
+        )
+        result["count"] = n
+        result["sum"] = total[cells]
+        result["mean"] = mean
+        result["std"] = np.where(n > 1, np.sqrt(np.clip(var, 0, None)), np.nan)
+        result["min"] = minimum[cells]
+        result["max"] = maximum[cells]
+        return result
@@ -0,0 +1,207 @@
+"""Loading of the cleaned flights dataset.
+
+The cleaned CSV is converted once into a Parquet file with an explicit
+schema. ``load_flights`` reads that file and only rebuilds it when the
+content of the CSV it was built from has changed.
+
+Build the Parquet file ahead of time with::
+
+    python -m dashboard.data
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+RAW_CSV = os.path.join("dataSet", "raw_airlines_flights_data.csv")
+CLEANED_CSV = os.path.join("dataSet", "cleaned_airlines_flights_data.csv")
+CLEANED_PARQUET = os.path.join("dataSet", "cleaned_airlines_flights_data.parquet")
+
+# Low-cardinality text columns, stored dictionary-encoded and loaded as
+# pandas categoricals.
+CATEGORICAL_COLUMNS = [
+    "airline",
+    "flight",
+    "source_city",
+    "departure_time",
+    "arrival_time",
+    "destination_city",
+    "class",
+]
+
+# Column types of the cleaned dataset, in file order. Integer widths are the
+# narrowest that hold the value ranges of the data (days_left <= 49,
+# stops <= 2, price < 2**31).
+SCHEMA = pa.schema([
+    ("airline", pa.dictionary(pa.int8(), pa.string())),
+    ("flight", pa.dictionary(pa.int16(), pa.string())),
+    ("source_city", pa.dictionary(pa.int8(), pa.string())),
+    ("departure_time", pa.dictionary(pa.int8(), pa.string())),
+    ("stops", pa.int8()),
+    ("arrival_time", pa.dictionary(pa.int8(), pa.string())),
+    ("destination_city", pa.dictionary(pa.int8(), pa.string())),
+    ("class", pa.dictionary(pa.int8(), pa.string())),
+    ("duration", pa.float32()),
+    ("days_left", pa.int8()),
+    ("price", pa.int32()),
+])
+
+# Bumped whenever SCHEMA changes, so existing Parquet files get rebuilt.
+SCHEMA_VERSION = 2
+
+# Parquet metadata key holding the fingerprint of the source CSV.
+_SOURCE_KEY = b"flights.source"
+
+_DIGEST_CHUNK_SIZE = 1 << 20
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def file_digest(path):
+    """SHA-256 of the file's content, cached until its size or mtime changes."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _digests_lock:
+        if key not in _digests:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_DIGEST_CHUNK_SIZE), b""):
+                    sha.update(chunk)
+            _digests[key] = sha.hexdigest()
+        return _digests[key]
+
+
+def source_fingerprint(csv_path=CLEANED_CSV):
+    """Return a small dict that changes whenever the CSV's content changes.
+
+    Only a change of content counts: copying or touching the file keeps its
+    fingerprint, so nothing built from it is rebuilt.
+    """
+    return {
+        "schema": SCHEMA_VERSION,
+        "sha256": file_digest(csv_path),
+    }
+
+
+def _csv_column_types():
+    # The CSV reader only dictionary-encodes with int32 indices; the narrower
+    # index types are applied afterwards.
+    return {
+        field.name: (
+            pa.dictionary(pa.int32(), pa.string())
+            if pa.types.is_dictionary(field.type)
+            else field.type
+        )
+        for field in SCHEMA
+    }
+
+
+def _sort_categories(df):
+    # Keep categories in alphabetical order so codes are stable across builds.
+    for col in CATEGORICAL_COLUMNS:
+        categories = df[col].cat.categories
+        if not categories.is_monotonic_increasing:
+            df[col] = df[col].cat.reorder_categories(categories.sort_values())
+    return df
+
+
+def read_csv_table(csv_path=CLEANED_CSV):
+    """Parse the cleaned CSV into an Arrow table with ``SCHEMA``."""
+    table = pv.read_csv(
+        csv_path,
+        convert_options=pv.ConvertOptions(
+            column_types=_csv_column_types(),
+            include_columns=SCHEMA.names,
+        ),
+    )
+    df = _sort_categories(table.to_pandas())
+    return pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+
+
+def build_parquet(csv_path=CLEANED_CSV, parquet_path=CLEANED_PARQUET):
+    """Convert ``csv_path`` into a typed Parquet file at ``parquet_path``."""
+    table = read_csv_table(csv_path)
+    metadata = {_SOURCE_KEY: json.dumps(source_fingerprint(csv_path)).encode()}
+    table = table.replace_schema_metadata(metadata)
+
+    # Write next to the target and rename, so readers never see a partial file.
+    # Processes starting together may all build it; each writes its own temp
+    # file, and whichever rename lands last leaves the same content.
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, parquet_path)
+    return parquet_path
+
+
+def parquet_is_current(csv_path=CLEANED_CSV, parquet_path=CLEANED_PARQUET):
+    """True if ``parquet_path`` exists and was built from the current CSV."""
+    if not os.path.exists(parquet_path):
+        return False
+    metadata = pq.read_schema(parquet_path).metadata or {}
+    stored = metadata.get(_SOURCE_KEY)
+    if stored is None:
+        return False
+    return json.loads(stored) == source_fingerprint(csv_path)
+
+
+def load_flights(csv_path=CLEANED_CSV, parquet_path=CLEANED_PARQUET):
+    """Load the cleaned dataset, rebuilding the Parquet cache if it is stale."""
+    if not parquet_is_current(csv_path, parquet_path):
+        build_parquet(csv_path, parquet_path)
+    return _sort_categories(pq.read_table(parquet_path).to_pandas())
+
+
+def memory_report(df):
+    """Compare the memory use of ``df`` with the untyped ``pd.read_csv`` frame.
+
+    The baseline holds every text column as Python object strings and every
+    numeric column as a 64-bit value, as a plain CSV read would.
+    """
+    baseline = df.astype({
+        col: object if col in CATEGORICAL_COLUMNS else (
+            "float64" if pd.api.types.is_float_dtype(df[col]) else "int64"
+        )
+        for col in df.columns
+    })
+    report = pd.DataFrame({
+        "baseline_bytes": baseline.memory_usage(index=False, deep=True),
+        "typed_bytes": df.memory_usage(index=False, deep=True),
+    })
+    report.loc["total"] = report.sum()
+    report["ratio"] = report["baseline_bytes"] / report["typed_bytes"]
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert the cleaned flights CSV into a typed Parquet file."
+    )
+    parser.add_argument("--csv", default=CLEANED_CSV, help="source CSV file")
+    parser.add_argument("--out", default=CLEANED_PARQUET, help="Parquet file to write")
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if the Parquet file is current"
+    )
+    parser.add_argument(
+        "--report", action="store_true", help="print memory use before and after typing"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.force and parquet_is_current(args.csv, args.out):
+        print(f"{args.out} is up to date")
+    else:
+        build_parquet(args.csv, args.out)
+        print(f"Wrote {args.out}")
+
+    if args.report:
+        report = memory_report(load_flights(args.csv, args.out))
+        print(report.to_string(float_format="{:.1f}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,618 @@
+"""Read-only, in-memory flights dataset shared by every page and session.
+
+``FlightDataset`` wraps the typed frame from ``dashboard.data`` together with
+the columns and aggregates derived from it. Everything is computed once at
+load; pages select rows with boolean masks and never copy or modify the
+frame. Masks on the filter columns come from a bitmap index, so a filter
+costs bitwise operations on packed bitmaps rather than a scan of the rows.
+
+A whole dataset (frame, derived columns and aggregates) can be written to
+one snapshot file: compressed, for shipping (``python -m
+dashboard.snapshot``), or mapped, with its arrays stored raw so that
+``read_snapshot`` maps them read-only instead of reading them. Every
+process on a host that opens the same mapped snapshot shares one copy of
+the data in the page cache. ``load_dataset`` and ``load_snapshot`` keep a
+mapped snapshot under ``DATASET_CACHE_DIR``, keyed by the content hash of
+the source CSV and by ``DATASET_CACHE_VERSION``, so restarts and extra
+worker processes attach to it instead of rebuilding or copying the data.
+"""
+import hashlib
+import mmap
+import os
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dashboard import timing
+from dashboard.bitmap import BitmapIndex
+from dashboard.cube import CUBE_DIMS, DAYS_BIN, PriceCube, days_bin_labels
+from dashboard.data import (
+    CLEANED_CSV,
+    CLEANED_PARQUET,
+    SCHEMA,
+    load_flights,
+    source_fingerprint,
+)
+from dashboard.distributions import box_stats, fine_histogram
+from dashboard.single_flight import SingleFlight
+
+# Columns of the cleaned CSV, i.e. the frame without the derived columns.
+SOURCE_COLUMNS = SCHEMA.names
+
+# Views handed out by ``FlightDataset.frame`` rely on copy-on-write, which is
+# only the default from pandas 3 on.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# Bin edges (in days) and labels of the booking windows used by the box
+# plots; the last window runs up to the largest days_left.
+BOOKING_WINDOW_EDGES = [0, 5, 10, 20, 30, 60, 90, 120]
+BOOKING_WINDOW_LABELS = ["0-5", "6-10", "11-20", "21-30", "31-60", "61-90", "91-120", "120+"]
+
+# Number of filter selections whose column bitmaps and ``FlightSelection``s
+# are kept; the oldest selection is dropped first.
+MAX_CACHED_FILTERS = 256
+MAX_CACHED_SELECTIONS = 16
+
+# Number of column groupings whose per-row cell codes are kept for the
+# crossfilters (one per grouping and bin width).
+MAX_CACHED_GROUP_CODES = 16
+
+# Directory of the on-disk dataset cache. Its files are pickles written by
+# ``load_dataset`` itself and are trusted like the rest of dataSet/.
+DATASET_CACHE_DIR = os.path.join("dataSet", ".cache")
+
+# Bumped whenever the derived columns, the aggregates or the attributes of
+# ``FlightDataset`` change, so cached datasets get rebuilt and older
+# snapshots are refused.
+DATASET_CACHE_VERSION = 4
+
+# Snapshot loaded by the app instead of the CSV when the file exists.
+SNAPSHOT_PATH = os.environ.get("FLIGHTS_SNAPSHOT", os.path.join("dataSet", "flights.snapshot"))
+
+# Codec of the pickled dataset inside a compressed snapshot file.
+SNAPSHOT_CODEC = "zstd"
+
+# Byte alignment of the raw arrays inside a mapped snapshot file.
+MAPPED_ALIGNMENT = 64
+
+
+# Deduplicates concurrent first computations of every dataset's lazily
+# built aggregates and views, across all sessions of the process.
+aggregate_flights = SingleFlight()
+
+# Held while a memoized entry is stored, so that computations of different
+# keys finishing together never evict the same oldest entry twice.
+_store_lock = threading.Lock()
+
+
+def _evict_oldest(cache, limit):
+    # Dicts keep insertion order, so the first key is the oldest entry.
+    while len(cache) >= limit:
+        cache.pop(next(iter(cache)))
+
+
+def add_derived_columns(df):
+    """Add ``booking_window`` to ``df`` in place.
+
+    * ``booking_window`` -- ordered categorical of ``BOOKING_WINDOW_LABELS``.
+
+    Day bins and routes are not stored per row: the trend charts and
+    crossfilters bin days_left for whatever width they draw, and routes are
+    counted from the cube.
+    """
+    days = df["days_left"].to_numpy()
+    bins = BOOKING_WINDOW_EDGES + [max(121, int(days.max()))]
+    df["booking_window"] = pd.cut(
+        df["days_left"], bins=bins, labels=BOOKING_WINDOW_LABELS, include_lowest=True
+    )
+    return df
+
+
+def summary_stats(duration, cube):
+    """Every figure shown on the Overview page, computed once at load.
+
+    Counts, means and extremes of price and days_left, the number of routes
+    and the cheapest/priciest airline all come from the cube (O(cells)); only
+    the mean of the ``duration`` array needs a pass over the rows.
+    """
+    n = cube.count.sum()
+    per_day = cube.rollup(["days_left"])
+    routes = cube.rollup(["source_city", "destination_city"])
+    by_airline = cube.rollup(["airline"]).set_index("airline")["mean"]
+
+    return {
+        "records": int(n),
+        "price_mean": cube.total.sum() / n,
+        "price_min": cube.minimum.min(),
+        "price_max": cube.maximum.max(),
+        "duration_mean": float(duration.mean(dtype=np.float64)),
+        "days_mean": (per_day["days_left"] * per_day["count"]).sum() / n,
+        "days_min": int(per_day["days_left"].min()),
+        "days_max": int(per_day["days_left"].max()),
+        "unique_routes": len(routes),
+        "cheapest_airline": by_airline.idxmin(),
+        "cheapest_price": by_airline.min(),
+        "expensive_airline": by_airline.idxmax(),
+        "expensive_price": by_airline.max(),
+    }
+
+
+class FlightDataset:
+    """The flights frame, its derived columns, aggregate cube and bitmap index.
+
+    ``frame`` must already carry the derived columns (see ``load_dataset``).
+    """
+
+    def __init__(self, frame, version=None):
+        self.version = version
+        self._frame = frame
+        self.cube = PriceCube.from_frame(self._frame)
+        self.index = BitmapIndex(self._frame)
+        self.summary = summary_stats(self._frame["duration"].to_numpy(), self.cube)
+        self._box_stats = {}
+        self._histograms = {}
+        self._sorted_indexes = {}
+        self._group_codes = {}
+        self._filter_bitmaps = {}
+        self._selections = {}
+
+    def __len__(self):
+        return len(self._frame)
+
+    def __getstate__(self):
+        # Per-selection caches are rebuilt on demand and not worth storing
+        state = self.__dict__.copy()
+        state["_filter_bitmaps"] = {}
+        state["_selections"] = {}
+        return state
+
+    def _memoized(self, name, key, compute, limit=None):
+        # compute() kept under `key` in the dict attribute `name`, holding at
+        # most `limit` entries; sessions asking for the same missing entry at
+        # once share a single computation
+        cache = getattr(self, name)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        def compute_and_store():
+            if key in cache:
+                return cache[key]
+            with timing.span(f"dataset.{name.strip('_')}", key=repr(key)):
+                value = compute()
+            with _store_lock:
+                if limit is not None:
+                    _evict_oldest(cache, limit)
+                cache[key] = value
+            return value
+        return aggregate_flights.do((id(self), name, key), compute_and_store)
+
+    def precompute(self):
+        """Compute the lazily built aggregates the unfiltered pages use.
+
+        Box statistics for all airlines and for each one, the fine histograms
+        and the sorted indexes behind the crossfilters.
+        """
+        self.box_stats()
+        for airline in self.cube.values("airline"):
+            self.box_stats(airline)
+        for column in ("price", "days_left"):
+            self.histogram(column)
+        for column in ("class", "days_left"):
+            self.sorted_index(column)
+
+    @property
+    def base(self):
+        """The dataset itself (see ``FlightSelection.base``)."""
+        return self
+
+    @property
+    def row_mask(self):
+        """None: every row is selected (see ``FlightSelection.row_mask``)."""
+        return None
+
+    @property
+    def frame(self):
+        """A zero-copy view of the shared frame.
+
+        The view shares its column arrays with the dataset; under pandas'
+        copy-on-write, adding or assigning columns on it leaves the shared
+        frame untouched.
+        """
+        return self._frame.copy(deep=False)
+
+    def mask(self, **equals):
+        """Boolean row mask for ``column == value`` on each keyword given.
+
+        A value may be a list of labels (any of them matches) or ``None``,
+        which leaves that column unfiltered. Indexed columns are combined as
+        bitmaps; any other column falls back to a comparison over the rows.
+        """
+        return self._mask(equals)
+
+    def _mask(self, equals, bitmap=None):
+        # mask(**equals), further restricted to the rows set in `bitmap`
+        indexed = {col: value for col, value in equals.items() if col in self.index}
+        selected = self.index.select(**indexed)
+        if bitmap is not None:
+            selected = selected & bitmap
+        mask = self.index.to_mask(selected)
+        for col, value in equals.items():
+            if value is not None and col not in self.index:
+                mask &= self._frame[col].isin(np.atleast_1d(value)).to_numpy()
+        return mask
+
+    def rows(self, mask=None):
+        """The rows selected by ``mask``; a view of every row if ``mask`` is None."""
+        if mask is None:
+            return self.frame
+        return self._frame[mask]
+
+    def box_stats(self, airline=None):
+        """Booking-window box statistics for one airline (all airlines if None).
+
+        Computed on first use and kept, so later calls are a dict lookup.
+        """
+        return self._memoized(
+            "_box_stats", airline, lambda: box_stats(self.rows(self.mask(airline=airline)))
+        )
+
+    def histogram(self, column):
+        """Fine-grained ``(counts, edges)`` histogram of ``column``, computed once."""
+        return self._memoized(
+            "_histograms", column, lambda: fine_histogram(self._frame[column].to_numpy())
+        )
+
+    def sorted_index(self, column):
+        """``(order, keys)``: row ids sorted by ``column`` and their sort keys.
+
+        Keys are the category codes of categorical columns and the values of
+        any other column. Computed once per column and shared by every
+        ``Crossfilter`` on the dataset.
+        """
+        def sort():
+            col = self._frame[column]
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                keys = col.cat.codes.to_numpy()
+            else:
+                keys = col.to_numpy()
+            order = np.argsort(keys, kind="stable")
+            return order, keys[order]
+        return self._memoized("_sorted_indexes", column, sort)
+
+    def group_codes(self, by, days_bin=None):
+        """``(codes, labels)``: the cell of each row in the grid of ``by`` columns.
+
+        ``labels`` maps each column to its labels, and ``codes`` holds the
+        row-major cell number of every row in the narrowest unsigned dtype
+        that fits. ``by`` may include ``"days_bin"`` with ``days_bin`` giving
+        the bin width, binned like ``PriceCube.rollup``. Computed once per
+        grouping and shared by every ``Crossfilter`` on the dataset.
+        """
+        def compute():
+            codes, labels = [], {}
+            for col in by:
+                if col == DAYS_BIN:
+                    code = (self._frame["days_left"].to_numpy() - 1) // days_bin
+                    labels[col] = np.array(days_bin_labels(int(code.max()) + 1, days_bin))
+                else:
+                    series = self._frame[col]
+                    if isinstance(series.dtype, pd.CategoricalDtype):
+                        labels[col] = series.cat.categories.to_numpy()
+                        code = series.cat.codes.to_numpy()
+                    else:
+                        labels[col], code = np.unique(series.to_numpy(), return_inverse=True)
+                codes.append(code)
+            shape = tuple(len(labels[col]) for col in by)
+            cells = np.ravel_multi_index(codes, shape)
+            return cells.astype(np.min_scalar_type(max(int(np.prod(shape)) - 1, 0))), labels
+        return self._memoized(
+            "_group_codes", (tuple(by), days_bin), compute, limit=MAX_CACHED_GROUP_CODES
+        )
+
+    def filter_bitmap(self, filters):
+        """Bitmap of the rows matching every ``column -> [labels]`` in ``filters``.
+
+        Each column's bitmap (the OR of its labels) is kept per selection, so
+        changing one column's selection only rebuilds that column's bitmap
+        before the final AND. Empty selections leave the column unfiltered.
+        """
+        bitmap = self.index.select()
+        for col, labels in filters.items():
+            if not labels:
+                continue
+            column_bitmap = self._memoized(
+                "_filter_bitmaps",
+                (col, frozenset(labels)),
+                lambda: self.index.column(col, list(labels)),
+                limit=MAX_CACHED_FILTERS,
+            )
+            bitmap = bitmap & column_bitmap
+        return bitmap
+
+    def select(self, filters):
+        """The rows matching ``filters`` as a ``FlightSelection``.
+
+        Returns ``self`` when nothing is filtered. Selections are kept for
+        the most recent ``MAX_CACHED_SELECTIONS`` distinct filters; each
+        holds the filters' bitmap and what has been aggregated over it, never
+        a copy of the rows.
+        """
+        key = tuple(sorted(
+            (col, tuple(sorted(labels))) for col, labels in filters.items() if labels
+        ))
+        if not key:
+            return self
+        def build():
+            return FlightSelection(self, dict(key), self.filter_bitmap(filters))
+        return self._memoized("_selections", key, build, limit=MAX_CACHED_SELECTIONS)
+
+
+class FlightSelection:
+    """The rows of a ``FlightDataset`` matching the sidebar filters, uncopied.
+
+    Offers the dataset's read API (``mask``, ``rows``, ``cube``, ``summary``,
+    ``box_stats``, ``histogram``) over the selected rows only. Masks are over
+    every row of ``base``, so they index its shared frame directly. The cube
+    is the base cube's cells for the selected labels when every filter is on
+    a cube dimension (O(cells), no pass over the rows), and is built from the
+    selected rows' codes otherwise. Aggregates are computed on first use and
+    kept. ``version`` is the base version plus the filters.
+    """
+
+    def __init__(self, base, filters, bitmap):
+        self.base = base
+        self.filters = filters      # column -> tuple of labels
+        self.version = (base.version, tuple(sorted(filters.items())))
+        self._bitmap = bitmap
+        self._aggregates = {}
+        self._box_stats = {}
+        self._histograms = {}
+
+    # Same memoization as the dataset's, per selection
+    _memoized = FlightDataset._memoized
+
+    def __len__(self):
+        return self.base.index.count(self._bitmap)
+
+    @property
+    def row_mask(self):
+        """Boolean mask of the selected rows, over every row of ``base``."""
+        return self.base.index.to_mask(self._bitmap)
+
+    @property
+    def frame(self):
+        """The selected rows, copied on each call.
+
+        Unlike ``FlightDataset.frame`` this is not a view; figure builders
+        that plot rows drop it once their figure is built.
+        """
+        return self.base._frame[self.row_mask]
+
+    def mask(self, **equals):
+        """Like ``FlightDataset.mask``, and only ever true on selected rows."""
+        return self.base._mask(equals, self._bitmap)
+
+    def rows(self, mask=None):
+        """The rows selected by ``mask``; every selected row if ``mask`` is None."""
+        return self.base._frame[self.row_mask if mask is None else mask]
+
+    @property
+    def cube(self):
+        def build():
+            if all(col in CUBE_DIMS for col in self.filters):
+                return self.base.cube.restrict(self.filters)
+            return PriceCube.from_frame(self.base._frame, mask=self.row_mask)
+        return self._memoized("_aggregates", "cube", build)
+
+    @property
+    def summary(self):
+        return self._memoized(
+            "_aggregates",
+            "summary",
+            lambda: summary_stats(self.base._frame["duration"].to_numpy()[self.row_mask], self.cube),
+        )
+
+    def box_stats(self, airline=None):
+        """Booking-window box statistics of the selected rows, as ``FlightDataset.box_stats``."""
+        return self._memoized(
+            "_box_stats", airline, lambda: box_stats(self.rows(self.mask(airline=airline)))
+        )
+
+    def histogram(self, column):
+        """Fine-grained ``(counts, edges)`` histogram of ``column`` over the selected rows."""
+        return self._memoized(
+            "_histograms",
+            column,
+            lambda: fine_histogram(self.base._frame[column].to_numpy()[self.row_mask]),
+        )
+
+
+def dataset_version(csv_path=CLEANED_CSV):
+    """Fingerprint of the CSV a dataset is built from, as a hashable tuple.
+
+    It changes with the content of the file, not with its mtime, so it can
+    key caches of anything derived from the data.
+    """
+    return tuple(sorted(source_fingerprint(csv_path).items()))
+
+
+def dataset_cache_path(version, cache_dir=DATASET_CACHE_DIR):
+    """Path of the cached dataset for ``version`` and the current code."""
+    key = repr((version, DATASET_CACHE_VERSION, pd.__version__, np.__version__))
+    return os.path.join(cache_dir, f"flights-{hashlib.sha256(key.encode()).hexdigest()[:24]}.snapshot")
+
+
+def _snapshot_header():
+    # Versions a snapshot must have been written with to be read back
+    return {
+        "cache_version": DATASET_CACHE_VERSION,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def write_snapshot(dataset, path, mapped=False):
+    """Write ``dataset`` with all its aggregates to one file at ``path``.
+
+    The file starts with a small pickled header (the versions in use, the
+    source fingerprint, the row count and the layout). By default it is
+    followed by the zstd-compressed pickle of the dataset. With
+    ``mapped=True`` nothing is compressed: the pickle holds everything but
+    the arrays (about 10 KB), which follow it as raw buffers aligned to
+    ``MAPPED_ALIGNMENT`` bytes. Per-selection caches are left out.
+    """
+    buffers = []
+    payload = pickle.dumps(
+        dataset,
+        protocol=pickle.HIGHEST_PROTOCOL,
+        buffer_callback=(lambda buffer: buffers.append(buffer.raw())) if mapped else None,
+    )
+    stored = payload if mapped else pa.compress(payload, codec=SNAPSHOT_CODEC, asbytes=True)
+    header = dict(
+        _snapshot_header(),
+        source=dict(dataset.version),
+        rows=len(dataset),
+        codec=None if mapped else SNAPSHOT_CODEC,
+        nbytes=len(payload),
+        stored_bytes=len(stored),
+        buffers=[buffer.nbytes for buffer in buffers],
+    )
+
+    # Write next to the target and rename, so readers never see a partial file.
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(stored)
+        for buffer in buffers:
+            f.write(bytes(-f.tell() % MAPPED_ALIGNMENT))
+            f.write(buffer)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot_header(path):
+    """The header dict of the snapshot at ``path``.
+
+    Raises ``ValueError`` if the snapshot was written by a different
+    ``DATASET_CACHE_VERSION`` or pandas/numpy version; it must be rebuilt.
+    """
+    with open(path, "rb") as f:
+        return _check_snapshot_header(path, pickle.load(f))
+
+
+def _check_snapshot_header(path, header):
+    expected = _snapshot_header()
+    found = {key: header.get(key) for key in expected}
+    if found != expected:
+        raise ValueError(
+            f"{path} was built with {found}, expected {expected}; "
+            "rebuild it with `python -m dashboard.snapshot`"
+        )
+    return header
+
+
+def read_snapshot(path):
+    """Read back a dataset written by ``write_snapshot``.
+
+    The arrays of a mapped snapshot are read-only views of the file mapped
+    into memory, shared with every other process mapping it. Raises
+    ``ValueError`` like ``read_snapshot_header``.
+    """
+    with open(path, "rb") as f:
+        header = _check_snapshot_header(path, pickle.load(f))
+        payload = f.read(header["stored_bytes"])
+        if header["codec"] is not None:
+            payload = pa.decompress(payload, header["nbytes"], codec=header["codec"], asbytes=True)
+        buffers = []
+        if header["buffers"]:
+            # The mapping stays open as long as an array uses it
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            offset = f.tell()
+            for nbytes in header["buffers"]:
+                offset += -offset % MAPPED_ALIGNMENT
+                buffers.append(view[offset:offset + nbytes])
+                offset += nbytes
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _read_cached_dataset(path):
+    # None if the file is missing, unreadable (e.g. truncated) or from another
+    # code version, so the dataset gets rebuilt
+    try:
+        return read_snapshot(path)
+    except Exception:
+        return None
+
+
+def _write_cached_dataset(dataset, path):
+    # Replace the entry, then drop the datasets cached for other sources or
+    # code versions. Processes still mapping a dropped file keep their copy.
+    # Only finished entries are dropped: the .tmp files are other processes'
+    # entries still being written, and another process may be dropping the
+    # same old entry at once.
+    write_snapshot(dataset, path, mapped=True)
+    cache_dir = os.path.dirname(path)
+    for name in os.listdir(cache_dir):
+        if name.startswith("flights-") and name.endswith(".snapshot") and name != os.path.basename(path):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+
+def build_dataset(csv_path=CLEANED_CSV, parquet_path=CLEANED_PARQUET):
+    """Build a ``FlightDataset`` from the CSV, with its aggregates precomputed."""
+    with timing.span("data.load_flights"):
+        frame = load_flights(csv_path, parquet_path)
+    with timing.span("dataset.derived_columns"):
+        add_derived_columns(frame)
+    with timing.span("dataset.aggregates"):
+        dataset = FlightDataset(frame, version=dataset_version(csv_path))
+        dataset.precompute()
+    return dataset
+
+
+def load_dataset(csv_path=CLEANED_CSV, parquet_path=CLEANED_PARQUET, cache_dir=DATASET_CACHE_DIR):
+    """Load the cleaned flights data into a ``FlightDataset``.
+
+    The dataset's ``version`` is ``dataset_version(csv_path)``. It is mapped
+    from the on-disk cache when an entry exists for that version; otherwise
+    it is built from the Parquet copy of the CSV, its aggregates are
+    precomputed, and it is cached and mapped back, so even the process that
+    built it shares its memory with the others. Pass ``cache_dir=None`` to
+    skip the cache and keep a private copy.
+    """
+    if cache_dir is None:
+        return build_dataset(csv_path, parquet_path)
+    path = dataset_cache_path(dataset_version(csv_path), cache_dir)
+    dataset = _read_cached_dataset(path)
+    if dataset is None:
+        _write_cached_dataset(build_dataset(csv_path, parquet_path), path)
+        dataset = read_snapshot(path)
+    return dataset
+
+
+def load_snapshot(path, cache_dir=DATASET_CACHE_DIR):
+    """Load the dataset of the snapshot at ``path``, sharing its memory.
+
+    A compressed snapshot is unpacked once into a mapped one under
+    ``cache_dir`` (keyed like ``load_dataset``'s entries), which this and
+    every later process on the host then maps. A mapped snapshot is mapped
+    directly. Raises ``ValueError`` like ``read_snapshot_header``.
+    """
+    header = read_snapshot_header(path)
+    if header["codec"] is None:
+        return read_snapshot(path)
+    mapped_path = dataset_cache_path(tuple(sorted(header["source"].items())), cache_dir)
+    dataset = _read_cached_dataset(mapped_path)
+    if dataset is None:
+        _write_cached_dataset(read_snapshot(path), mapped_path)
+        dataset = read_snapshot(mapped_path)
+    return dataset
@@ -0,0 +1,102 @@
+"""Server-side summaries of distributions for the box plots and histograms."""
+import numpy as np
+import pandas as pd
+
+# Most outliers kept per box; the rest are thinned out evenly.
+MAX_OUTLIERS = 40
+
+# Columns of a box_stats frame after the group column.
+BOX_STATS_COLUMNS = ["count", "q1", "median", "q3", "mean", "lowerfence", "upperfence", "outliers"]
+
+# Resolution of the precomputed histograms. Coarser histograms are made by
+# merging these bins, so the bin counts offered in the app divide it evenly.
+FINE_HISTOGRAM_BINS = 480
+
+
+def _thin(values, limit):
+    # Keep ``limit`` evenly spaced values of the sorted array, always
+    # including both extremes.
+    if len(values) <= limit:
+        return values
+    return values[np.linspace(0, len(values) - 1, limit).round().astype(int)]
+
+
+def box_stats(frame, by="booking_window", value="price", max_outliers=MAX_OUTLIERS):
+    """Quartiles, whiskers, mean and capped outliers of ``value`` per ``by`` group.
+
+    Follows Plotly's defaults: linear-interpolated quartiles, and whiskers at
+    the most extreme values within 1.5 IQR of the box. Returns one row per
+    non-empty group, in category order, with columns ``by``, ``count``,
+    ``q1``, ``median``, ``q3``, ``mean``, ``lowerfence``, ``upperfence`` and
+    ``outliers`` (a sorted array of at most ``max_outliers`` prices); the
+    columns are there even when no group has rows.
+    """
+    groups = frame[by]
+    codes = groups.cat.codes.to_numpy()
+    values = frame[value].to_numpy(dtype=np.float64)
+
+    # One sort puts every group's values next to each other, in order.
+    order = np.lexsort((values, codes))
+    codes = codes[order]
+    values = values[order]
+    bounds = np.searchsorted(codes, np.arange(len(groups.cat.categories) + 1))
+
+    rows = []
+    for code, label in enumerate(groups.cat.categories):
+        group = values[bounds[code]:bounds[code + 1]]
+        if len(group) == 0:
+            continue
+        q1, median, q3 = np.quantile(group, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = group[(group >= q1 - 1.5 * iqr) & (group <= q3 + 1.5 * iqr)]
+        lowerfence, upperfence = inside[0], inside[-1]
+        outliers = group[(group < lowerfence) | (group > upperfence)]
+        rows.append({
+            by: label,
+            "count": len(group),
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "mean": group.mean(),
+            "lowerfence": lowerfence,
+            "upperfence": upperfence,
+            "outliers": _thin(outliers, max_outliers),
+        })
+    return pd.DataFrame(rows, columns=[by, *BOX_STATS_COLUMNS])
+
+
+def fine_histogram(values, n_bins=FINE_HISTOGRAM_BINS):
+    """Counts and bin edges of ``values`` at the finest resolution kept.
+
+    Integer columns spanning at most ``n_bins`` values (e.g. days_left) get
+    one bin per value; anything else gets ``n_bins`` equal-width bins between
+    its minimum and maximum.
+    """
+    values = np.asarray(values)
+    low, high = values.min(), values.max()
+    if np.issubdtype(values.dtype, np.integer) and high - low < n_bins:
+        low, high = int(low), int(high)
+        counts = np.bincount(values.astype(np.int64) - low, minlength=high - low + 1)
+        edges = np.arange(low, high + 2) - 0.5
+        return counts, edges
+    counts, edges = np.histogram(values, bins=n_bins)
+    return counts, edges
+
+
+def coarsen_histogram(counts, edges, n_bins):
+    """Merge adjacent bins of a fine histogram into at most ``n_bins`` equal bins.
+
+    Every merged bin takes the same number of fine bins, so e.g. one-day bins
+    of days_left become bins of a whole number of days rather than a mix of
+    widths; when that number does not divide the fine bins the last bin is
+    only partly covered by the data, but drawn at full width. Costs
+    O(len(counts)); the rows behind the histogram are not needed.
+    """
+    if n_bins >= len(counts):
+        return counts, edges
+    width = -(-len(counts) // n_bins)
+    starts = np.arange(0, len(counts), width)
+    # Fine bins are of equal width, so the last edge extends them
+    missing = starts[-1] + width - len(counts)
+    last = edges[-1] + missing * (edges[1] - edges[0])
+    return np.add.reduceat(counts, starts), np.append(edges[starts], last)
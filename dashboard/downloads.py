@@ -0,0 +1,126 @@
+"""Dataset downloads and exports of the rows behind a chart.
+
+Each full-dataset download is written once per source file content to
+``dataSet/.downloads/<sha256>.<ext>`` by streaming the source in chunks, and
+is then shared by every session. The app hands Streamlit a callable that
+opens the file, so nothing is read or serialised until a user clicks.
+
+Filtered exports (``export_rows``) walk the selected row indices of the
+shared frame in fixed-size chunks, so only one chunk is ever copied.
+"""
+import gzip
+import io
+import os
+import shutil
+import threading
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from dashboard.data import file_digest
+
+DOWNLOAD_DIR = os.path.join("dataSet", ".downloads")
+
+# Format name -> (file extension, MIME type).
+FORMATS = {
+    "CSV": (".csv", "text/csv"),
+    "CSV (gzip)": (".csv.gz", "application/gzip"),
+    "Parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+# Formats offered for filtered exports.
+EXPORT_FORMATS = ["CSV", "Parquet"]
+
+# Rows copied out of the shared frame at a time by ``export_rows``.
+EXPORT_CHUNK_ROWS = 50_000
+
+_CHUNK_SIZE = 1 << 20
+_build_lock = threading.Lock()
+
+
+def _write_gzip(csv_path, out_path):
+    with open(csv_path, "rb") as src, gzip.open(out_path, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+
+def _write_parquet(csv_path, out_path):
+    # Read and write one record batch at a time.
+    reader = pv.open_csv(csv_path)
+    with pq.ParquetWriter(out_path, reader.schema, compression="zstd") as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+
+
+def download_path(csv_path, fmt):
+    """Path of ``csv_path`` converted to ``fmt``, building it on first use."""
+    if fmt == "CSV":
+        return csv_path
+
+    ext, _ = FORMATS[fmt]
+    out_path = os.path.join(DOWNLOAD_DIR, file_digest(csv_path) + ext)
+    with _build_lock:
+        if not os.path.exists(out_path):
+            os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+            # Per-process temp file: other workers may be building it too
+            tmp_path = f"{out_path}.{os.getpid()}.tmp"
+            if fmt == "CSV (gzip)":
+                _write_gzip(csv_path, tmp_path)
+            else:
+                _write_parquet(csv_path, tmp_path)
+            os.replace(tmp_path, out_path)
+    return out_path
+
+
+def download_file_name(csv_path, fmt):
+    """File name offered to the browser, e.g. ``raw_airlines_flights_data.csv.gz``."""
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return stem + FORMATS[fmt][0]
+
+
+def opener(csv_path, fmt):
+    """Zero-argument callable returning the download as an open binary file."""
+    def open_download():
+        return open(download_path(csv_path, fmt), "rb")
+    return open_download
+
+
+def _chunks(frame, index, columns):
+    positions = [frame.columns.get_loc(col) for col in columns]
+    for start in range(0, len(index), EXPORT_CHUNK_ROWS):
+        yield frame.iloc[index[start:start + EXPORT_CHUNK_ROWS], positions]
+
+
+def export_rows(frame, mask, fmt, columns):
+    """Serialise the rows of ``frame`` selected by ``mask`` to a CSV or Parquet buffer.
+
+    ``mask`` is a boolean row mask (``None`` for every row). Rows are copied
+    out ``EXPORT_CHUNK_ROWS`` at a time and written straight to the output,
+    which is returned as the rewound ``BytesIO`` itself: ``getvalue()`` here
+    would hold a second copy of a large export while it is handed over.
+    """
+    index = np.arange(len(frame)) if mask is None else np.flatnonzero(mask)
+    out = io.BytesIO()
+    if fmt == "CSV":
+        if len(index) == 0:
+            frame.iloc[:0][columns].to_csv(out, index=False)
+        for i, chunk in enumerate(_chunks(frame, index, columns)):
+            chunk.to_csv(out, index=False, header=(i == 0))
+    else:
+        schema = pa.Schema.from_pandas(frame.iloc[:0][columns], preserve_index=False)
+        with pq.ParquetWriter(out, schema) as writer:
+            for chunk in _chunks(frame, index, columns):
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    out.seek(0)
+    return out
+
+
+def export_table(table, fmt):
+    """Serialise a small aggregated table to CSV or Parquet bytes."""
+    out = io.BytesIO()
+    if fmt == "CSV":
+        table.to_csv(out, index=False)
+    else:
+        table.to_parquet(out, index=False)
+    return out.getvalue()
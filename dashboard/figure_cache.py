@@ -0,0 +1,127 @@
+"""Process-wide LRU cache of built Plotly figures, bounded by size.
+
+Entries are whatever a figure builder returns: a figure, or a tuple of a
+figure and the table behind it. The size of an entry is estimated from the
+arrays and strings in each figure's traces and layout plus the memory of
+each DataFrame, measured once when it is stored; the least recently used
+entries are dropped once the total goes over ``max_bytes``. Concurrent
+misses on the same key build it once (see ``dashboard.single_flight``).
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.single_flight import SingleFlight
+
+# Default budget of a FigureCache, in bytes.
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def _props_size(value):
+    # Bytes of the arrays, strings and numbers in a figure's property dicts
+    if isinstance(value, dict):
+        return sum(_props_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_props_size(v) for v in value)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object and value.size:
+            # Object arrays (labels, hover text): pointers plus one element's size each
+            return value.nbytes + value.size * sys.getsizeof(value.flat[0])
+        return value.nbytes
+    if isinstance(value, str):
+        return len(value)
+    return 8
+
+
+def entry_size(value):
+    """Approximate bytes held by a cached figure, table or tuple of them."""
+    # Imported here: plotly is loaded by the pages that build figures, not at startup
+    import plotly.graph_objects as go
+
+    if isinstance(value, tuple):
+        return sum(entry_size(v) for v in value)
+    if isinstance(value, go.Figure):
+        # The figure's own trace and layout dicts, read without the deep copy
+        # that every public accessor (to_dict(), to_plotly_json(), to_json())
+        # makes. They are plotly internals, hence the plotly pin in
+        # requirements.txt; should they go, the JSON length is used instead.
+        data, layout = getattr(value, "_data", None), getattr(value, "_layout", None)
+        if isinstance(data, list) and isinstance(layout, dict):
+            return _props_size(data) + _props_size(layout)
+        return len(value.to_json())
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return sys.getsizeof(value)
+
+
+class FigureCache:
+    """Thread-safe LRU mapping of hashable keys to built figures."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # key -> (value, size)
+        self._lock = threading.Lock()
+        self._builds = SingleFlight()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, build):
+        """The value cached under ``key``, calling ``build()`` to make it on a miss.
+
+        ``build`` runs outside the lock. Callers missing a key that is being
+        built wait for that build instead of starting their own.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        return self._builds.do(key, lambda: self._build(key, build))
+
+    def _build(self, key, build):
+        # A build of `key` may have finished between the lookup and this call
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][0]
+
+        value = build()
+        size = entry_size(value)
+        with self._lock:
+            if size <= self.max_bytes:
+                self._entries[key] = (value, size)
+                self.nbytes += size
+                while self.nbytes > self.max_bytes:
+                    _, (_, dropped) = self._entries.popitem(last=False)
+                    self.nbytes -= dropped
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Counters and size as a dict, e.g. for logging."""
+        builds = self._builds.stats()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "deduplicated": builds["deduplicated"],
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
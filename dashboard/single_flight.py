@@ -0,0 +1,65 @@
+"""Run each computation once even when several sessions ask for it at once.
+
+Streamlit serves every session from its own thread, so after a restart or a
+new dataset version many sessions can miss the same cache entry at the same
+moment. ``SingleFlight.do(key, compute)`` lets the first caller compute
+while concurrent callers with the same key wait for, and share, its result
+(or its exception). Nothing is kept once the computation finishes; callers
+store results in their own caches before it does.
+"""
+import threading
+
+
+class _Call:
+    # One computation in progress and the callers waiting for it
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent computations of the same hashable key."""
+
+    def __init__(self):
+        self.calls = 0          # computations run
+        self.deduplicated = 0   # calls that waited for another caller's result
+        self._in_flight = {}    # key -> _Call
+        self._lock = threading.Lock()
+
+    def do(self, key, compute):
+        """Return ``compute()``, or the result of the same key's call in progress."""
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.calls += 1
+            else:
+                self.deduplicated += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = compute()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.value
+
+    def stats(self):
+        """Counters as a dict, e.g. for logging."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "deduplicated": self.deduplicated,
+                "in_flight": len(self._in_flight),
+            }
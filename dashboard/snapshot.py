@@ -0,0 +1,62 @@
+"""Build the dataset snapshot the app loads at startup.
+
+A snapshot is one compressed file holding the typed frame with its derived
+columns, the aggregate cube, the bitmap index, the fine histograms, the
+box-plot statistics and the Overview metrics (see
+``dashboard.dataset.write_snapshot``). When ``SNAPSHOT_PATH`` exists, the
+app reads it instead of the CSV, so replicas shipped with a snapshot start
+without parsing or aggregating anything. The first worker process on a
+host unpacks it into a mapped copy under ``dataSet/.cache`` that every
+worker then shares (see ``load_snapshot``); ``--mapped`` writes that form
+directly. Build one with::
+
+    python -m dashboard.snapshot --out dataSet/flights.snapshot
+
+``SNAPSHOT_PATH`` defaults to ``dataSet/flights.snapshot`` and can be moved
+with the ``FLIGHTS_SNAPSHOT`` environment variable. A snapshot is only read
+by the same ``DATASET_CACHE_VERSION`` and pandas/numpy versions that wrote
+it; rebuild it after upgrading either.
+"""
+import argparse
+import os
+import time
+
+from dashboard.data import CLEANED_CSV, CLEANED_PARQUET
+from dashboard.dataset import SNAPSHOT_PATH, build_dataset, read_snapshot, write_snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build the flights dataset snapshot loaded by the app at startup."
+    )
+    parser.add_argument("--csv", default=CLEANED_CSV, help="source CSV file")
+    parser.add_argument(
+        "--parquet", default=CLEANED_PARQUET, help="typed Parquet copy of the CSV, rebuilt if stale"
+    )
+    parser.add_argument("--out", default=SNAPSHOT_PATH, help="snapshot file to write")
+    parser.add_argument(
+        "--mapped",
+        action="store_true",
+        help="write an uncompressed snapshot that workers map directly (about 3x larger)",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="read the snapshot back and report its load time"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    dataset = build_dataset(args.csv, args.parquet)
+    write_snapshot(dataset, args.out, mapped=args.mapped)
+    print(
+        f"Wrote {args.out}: {len(dataset):,} rows, "
+        f"{os.path.getsize(args.out) / 2**20:.1f} MiB in {time.perf_counter() - start:.1f} s"
+    )
+
+    if args.check:
+        start = time.perf_counter()
+        loaded = read_snapshot(args.out)
+        print(f"Read back {len(loaded):,} rows in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
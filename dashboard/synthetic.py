@@ -0,0 +1,199 @@
+"""Synthetic flights data with the cleaned dataset's schema, for scale testing.
+
+Rows are drawn from a fixed catalogue of flights (airline, flight number,
+route, departure and arrival slot, stops, duration), so category
+cardinalities match the Kaggle data: 6 airlines, about 1,600 flight
+numbers, 6 cities, 6 time slots, business class only on Air_India and
+Vistara. Each row then gets a class, a days_left in 1-49 and a price that
+rises towards departure along a curve per airline and class.
+
+Rows are generated and written ``chunk_rows`` at a time, each chunk from
+its own seeded generator, so memory stays flat at any size and the same
+seed always gives the same file::
+
+    python -m dashboard.synthetic --rows 10M --out dataSet/flights_10m.parquet
+
+The output is CSV (like ``dataSet/cleaned_airlines_flights_data.csv``) or,
+for a ``.parquet`` path, Parquet with ``dashboard.data.SCHEMA``.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+
+from dashboard.data import SCHEMA
+
+CITIES = ["Bangalore", "Chennai", "Delhi", "Hyderabad", "Kolkata", "Mumbai"]
+TIME_SLOTS = ["Afternoon", "Early_Morning", "Evening", "Late_Night", "Morning", "Night"]
+CLASSES = ["Business", "Economy"]
+
+# Airline -> flight-number prefix, share of rows, number of flight numbers,
+# share of its rows in business class, and its price curve per class as
+# (fare booked well ahead, extra fraction paid on the last day, days over
+# which that extra decays). Shares and fares follow the Kaggle data.
+AIRLINES = {
+    "Air_India": ("AI", 0.270, 218, 0.40, {"Economy": (6300, 1.6, 9.0), "Business": (47000, 0.45, 12.0)}),
+    "AirAsia": ("I5", 0.054, 115, 0.0, {"Economy": (3600, 1.7, 8.0)}),
+    "GO_FIRST": ("G8", 0.077, 205, 0.0, {"Economy": (5200, 1.4, 8.0)}),
+    "Indigo": ("6E", 0.144, 704, 0.0, {"Economy": (4900, 1.5, 8.0)}),
+    "SpiceJet": ("SG", 0.030, 186, 0.0, {"Economy": (5700, 1.4, 9.0)}),
+    "Vistara": ("UK", 0.425, 133, 0.48, {"Economy": (7300, 1.5, 9.0), "Business": (52000, 0.5, 12.0)}),
+}
+
+# Share of flights with 0, 1 and 2 stops, and the price factor of each.
+STOPS_SHARE = [0.12, 0.83, 0.05]
+STOPS_PRICE_FACTOR = [0.55, 1.0, 1.05]
+
+# Spread of prices around the curve (sigma of a lognormal factor).
+PRICE_NOISE = 0.22
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def parse_rows(text):
+    """Row count from e.g. ``"300000"``, ``"1M"``, ``"2.5k"`` or ``"100M"``."""
+    text = text.strip().upper().replace("_", "")
+    for suffix, factor in (("K", 10**3), ("M", 10**6), ("B", 10**9)):
+        if text.endswith(suffix):
+            return int(float(text[:-1]) * factor)
+    return int(text)
+
+
+def flight_catalogue(seed=0):
+    """One row per flight number: its airline, route, slots, stops and duration."""
+    rng = np.random.default_rng([seed, 0])
+    names = list(AIRLINES)
+    airline = np.repeat(np.arange(len(names), dtype=np.int8), [AIRLINES[a][2] for a in names])
+    n = len(airline)
+
+    numbers = np.concatenate([
+        rng.choice(np.arange(100, 10000), AIRLINES[a][2], replace=False) for a in names
+    ])
+    flight = np.array([f"{AIRLINES[names[a]][0]}-{num}" for a, num in zip(airline, numbers)])
+
+    source = rng.integers(0, len(CITIES), n)
+    destination = (source + rng.integers(1, len(CITIES), n)) % len(CITIES)
+    stops = rng.choice(3, n, p=STOPS_SHARE).astype(np.int8)
+    # Non-stop flights take 1-3 hours; each stop adds a layover of up to a day
+    duration = rng.uniform(1.0, 3.0, n) + stops * rng.gamma(2.0, 5.0, n)
+    departure = rng.integers(0, len(TIME_SLOTS), n)
+    arrival = (departure + np.ceil(duration / 4)).astype(int) % len(TIME_SLOTS)
+
+    # Each airline's rows are spread over its flight numbers
+    weight = np.array([AIRLINES[names[a]][1] / AIRLINES[names[a]][2] for a in airline])
+    return {
+        "airline": airline,
+        "flight": flight,
+        "source_city": source.astype(np.int8),
+        "departure_time": departure.astype(np.int8),
+        "stops": stops,
+        "arrival_time": arrival.astype(np.int8),
+        "destination_city": destination.astype(np.int8),
+        "duration": duration,
+        "weight": weight / weight.sum(),
+    }
+
+
+def _price_curves():
+    # (airline code, class code) -> (base fare, last-day extra, decay in days)
+    names = list(AIRLINES)
+    table = np.zeros((len(names), len(CLASSES), 3))
+    for a, name in enumerate(names):
+        for c, flight_class in enumerate(CLASSES):
+            curves = AIRLINES[name][4]
+            table[a, c] = curves.get(flight_class, curves["Economy"])
+    return table
+
+
+def generate_chunk(catalogue, n_rows, seed, chunk_index):
+    """``n_rows`` synthetic rows as an Arrow table with ``SCHEMA``."""
+    rng = np.random.default_rng([seed, chunk_index + 1])
+    flight = rng.choice(len(catalogue["flight"]), n_rows, p=catalogue["weight"])
+    airline = catalogue["airline"][flight]
+
+    business_share = np.array([AIRLINES[name][3] for name in AIRLINES])
+    flight_class = np.where(
+        rng.random(n_rows) < business_share[airline], CLASSES.index("Business"), CLASSES.index("Economy")
+    ).astype(np.int8)
+    days_left = rng.integers(1, 50, n_rows, dtype=np.int8)
+    stops = catalogue["stops"][flight]
+
+    curve = _price_curves()[airline, flight_class]
+    price = (
+        curve[:, 0]
+        * (1 + curve[:, 1] * np.exp(-(days_left - 1) / curve[:, 2]))
+        * np.take(STOPS_PRICE_FACTOR, stops)
+        * rng.lognormal(0.0, PRICE_NOISE, n_rows)
+    )
+    duration = np.clip(catalogue["duration"][flight] * rng.uniform(0.97, 1.03, n_rows), 0.83, 49.83)
+
+    def categorical(codes, labels, field):
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, type=field.type.index_type), pa.array(labels, pa.string())
+        )
+
+    columns = {
+        "airline": categorical(airline, list(AIRLINES), SCHEMA.field("airline")),
+        "flight": categorical(flight, catalogue["flight"], SCHEMA.field("flight")),
+        "source_city": categorical(catalogue["source_city"][flight], CITIES, SCHEMA.field("source_city")),
+        "departure_time": categorical(catalogue["departure_time"][flight], TIME_SLOTS, SCHEMA.field("departure_time")),
+        "stops": pa.array(stops, pa.int8()),
+        "arrival_time": categorical(catalogue["arrival_time"][flight], TIME_SLOTS, SCHEMA.field("arrival_time")),
+        "destination_city": categorical(catalogue["destination_city"][flight], CITIES, SCHEMA.field("destination_city")),
+        "class": categorical(flight_class, CLASSES, SCHEMA.field("class")),
+        "duration": pa.array(np.round(duration, 2), pa.float32()),
+        "days_left": pa.array(days_left, pa.int8()),
+        "price": pa.array(np.round(price), pa.int32()),
+    }
+    return pa.table(columns, schema=SCHEMA)
+
+
+def write_synthetic(path, n_rows, seed=0, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Write ``n_rows`` synthetic rows to ``path`` (CSV, or Parquet for ``.parquet``)."""
+    catalogue = flight_catalogue(seed)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        if path.endswith(".parquet"):
+            writer = pq.ParquetWriter(f, SCHEMA, compression="zstd")
+        else:
+            # Unquoted header and values, like the cleaned CSV
+            f.write((",".join(SCHEMA.names) + "\n").encode())
+            writer = pv.CSVWriter(
+                f, SCHEMA, write_options=pv.WriteOptions(include_header=False, quoting_style="none")
+            )
+        with writer:
+            for chunk_index, start in enumerate(range(0, n_rows, chunk_rows)):
+                writer.write_table(
+                    generate_chunk(catalogue, min(chunk_rows, n_rows - start), seed, chunk_index)
+                )
+    os.replace(tmp_path, path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic flights dataset with the cleaned CSV's schema."
+    )
+    parser.add_argument("--rows", type=parse_rows, default="1M", help="row count, e.g. 1M, 10M, 100M")
+    parser.add_argument("--out", required=True, help="output file, .csv or .parquet")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--chunk-rows", type=parse_rows, default=DEFAULT_CHUNK_ROWS, help="rows generated and written at a time"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    write_synthetic(args.out, args.rows, args.seed, args.chunk_rows)
+    print(
+        f"Wrote {args.out}: {args.rows:,} rows, "
+        f"{os.path.getsize(args.out) / 2**20:.1f} MiB in {time.perf_counter() - start:.1f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Timing spans per rerun, to see which stage of a page the time goes to.
+
+Set ``FLIGHTS_TIMING=1`` to record them. Each rerun of the app is one trace
+(``start_trace`` / ``finish_trace``), kept per thread since Streamlit runs
+every session's script in its own thread. Stages are timed with::
+
+    with timing.span("cube.rollup", by="airline"):
+        ...
+
+Spans nest, and a span started while no trace is open (the warm-up thread,
+scripts, or with timing off) costs one thread-local lookup and records
+nothing. A finished trace is logged as one JSON line on the
+``dashboard.timing`` logger, and appended to ``FLIGHTS_TIMING_LOG`` when
+that is set (which also turns timing on). Reruns cut short by
+``st.stop()`` or a new rerun are dropped.
+"""
+import datetime
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+LOG_PATH = os.environ.get("FLIGHTS_TIMING_LOG")
+ENABLED = bool(LOG_PATH) or os.environ.get("FLIGHTS_TIMING", "") not in ("", "0")
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+_log_lock = threading.Lock()
+_log_handler = None
+
+
+class Trace:
+    """The spans of one rerun, in the order they started."""
+
+    def __init__(self, **attrs):
+        self.attrs = attrs
+        self.spans = []
+        self.depth = 0
+        self.started = time.perf_counter()
+        self.duration = None
+
+    def note(self, **attrs):
+        self.attrs.update(attrs)
+
+    def to_dict(self):
+        return {
+            "time": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="milliseconds"),
+            **self.attrs,
+            "ms": _ms(self.duration),
+            "spans": [span.to_dict(self.started) for span in self.spans],
+        }
+
+
+class Span:
+    """One timed stage; ``note()`` adds attributes such as a cache hit."""
+
+    def __init__(self, trace, name, attrs):
+        self.trace = trace
+        self.name = name
+        self.attrs = attrs
+        self.depth = trace.depth
+        self.started = None
+        self.duration = None
+
+    def note(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.trace.spans.append(self)
+        self.trace.depth += 1
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.duration = time.perf_counter() - self.started
+        self.trace.depth -= 1
+        return False
+
+    def to_dict(self, origin):
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "start_ms": _ms(self.started - origin),
+            "ms": _ms(self.duration),
+            **self.attrs,
+        }
+
+
+class _NoSpan:
+    # Returned by span() outside a trace
+    def note(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def span(name, **attrs):
+    """Context manager timing ``name`` within the current thread's trace."""
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return _NO_SPAN
+    return Span(trace, name, attrs)
+
+
+def timed(name):
+    """Decorator timing every call of a function as a span called ``name``."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(_local, "trace", None) is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def note(**attrs):
+    """Add attributes (e.g. the page shown) to this thread's trace, if any."""
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.note(**attrs)
+
+
+def current_trace():
+    """The trace open on this thread, or None."""
+    return getattr(_local, "trace", None)
+
+
+def start_trace(**attrs):
+    """Open a trace on this thread (replacing an unfinished one); None when timing is off."""
+    if not ENABLED:
+        return None
+    _local.trace = Trace(**attrs)
+    return _local.trace
+
+
+def finish_trace():
+    """Close and log this thread's trace, returning it (None if there was none)."""
+    trace = getattr(_local, "trace", None)
+    if trace is None:
+        return None
+    _local.trace = None
+    trace.duration = time.perf_counter() - trace.started
+    _log(trace)
+    return trace
+
+
+def _log(trace):
+    global _log_handler
+    if LOG_PATH and _log_handler is None:
+        with _log_lock:
+            if _log_handler is None:
+                _log_handler = logging.FileHandler(LOG_PATH)
+                _log_handler.setFormatter(logging.Formatter("%(message)s"))
+                logger.addHandler(_log_handler)
+                logger.setLevel(logging.INFO)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(trace.to_dict(), default=str))
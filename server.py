@@ -0,0 +1,32 @@
+"""Serve the dashboard with a start-up warm-up and a readiness endpoint.
+
+    streamlit run server.py        # or: uvicorn server:app --port 8501
+
+Same app as ``streamlit run app.py``, except that loading the data and
+building every page's default figures starts with the server, in a
+background thread, instead of on the first visit. ``GET /ready`` answers
+503 until that is done and 200 afterwards, so a load balancer can hold
+traffic until then; ``/_stcore/health`` still reports the server itself.
+"""
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from views import warmup
+
+
+@asynccontextmanager
+async def lifespan(app):
+    warmup.start()
+    yield
+
+
+async def ready(request):
+    if warmup.ready.is_set():
+        return PlainTextResponse("ready")
+    return PlainTextResponse("warming up", status_code=503)
+
+
+app = st.App("app.py", lifespan=lifespan, routes=[Route("/ready", ready)])
@@ -0,0 +1,69 @@
+"""The shared FlightDataset is never modified by the pages drawing it."""
+import hashlib
+import importlib
+import os
+
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from dashboard.data import CLEANED_CSV
+from dashboard.synthetic import write_synthetic
+from views import PAGES
+from views.common import flights_dataset
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def column_hashes(frame):
+    # Content hash of each column: values, categories and dtype
+    return {
+        col: hashlib.sha256(
+            pd.util.hash_pandas_object(frame[col], index=False).to_numpy().tobytes()
+            + str(frame[col].dtype).encode()
+        ).hexdigest()
+        for col in frame.columns
+    }
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    # A small synthetic dataset under a fresh dataSet/, loaded like the app does
+    monkeypatch.chdir(tmp_path)
+    write_synthetic(CLEANED_CSV, 20_000, seed=1)
+    return flights_dataset()
+
+
+def test_builders_leave_frame_unchanged(dataset):
+    before = column_hashes(dataset.frame)
+    for module in PAGES.values():
+        page = importlib.import_module(f"views.{module}")
+        if hasattr(page, "warm_up"):
+            page.warm_up(dataset)
+    assert column_hashes(dataset.frame) == before
+
+
+# Sidebar filters the pages are drawn with: none, one answered from the cube
+# and one answered from the selected rows
+SIDEBAR_FILTERS = [{}, {"filter_class": ["Economy"]}, {"filter_departure_time": ["Morning"]}]
+
+
+def test_pages_leave_frame_unchanged(dataset):
+    before = column_hashes(dataset.frame)
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    for filters in SIDEBAR_FILTERS:
+        for widget in at.sidebar.multiselect:
+            widget.set_value(filters.get(widget.key, []))
+        for page, module in PAGES.items():
+            at.sidebar.radio[0].set_value(page).run()
+            assert not at.exception, (filters, page, at.exception)
+            for tab in [tab.label for tab in at.tabs]:
+                at.session_state[f"{module}_tabs"] = tab
+                at.run()
+                assert not at.exception, (filters, page, tab, at.exception)
+
+    # The app drew its pages from this very dataset, which is unchanged
+    assert flights_dataset() is dataset
+    assert column_hashes(dataset.frame) == before
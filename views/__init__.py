@@ -0,0 +1,14 @@
+"""One module per dashboard page, imported by ``app.py`` on first visit."""
+
+# Sidebar label -> module in views/ drawing that page. A page module (and
+# what it imports, e.g. plotly.express) is only imported on its first visit.
+# Pages with tabs key them "<module>_tabs".
+PAGES = {
+    "Overview": "overview",
+    "Research Question 1": "rq1",
+    "Research Question 2": "rq2",
+    "Research Question 3": "rq3",
+    "Research Question 4": "rq4",
+    "Research Question 5": "rq5",
+    "Summary & Conclusion": "summary",
+}
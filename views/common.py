@@ -0,0 +1,402 @@
+"""Widgets, styles and helpers shared by the dashboard pages in ``views``.
+
+Helpers that read or filter rows take the page's ``FlightDataset`` as their
+first argument; nothing here holds per-session state outside
+``st.session_state``.
+"""
+import functools
+import logging
+import os
+
+import streamlit as st
+
+from dashboard import downloads, timing
+from dashboard.crossfilter import Crossfilter
+from dashboard.cube import days_bin_days
+from dashboard.dataset import (
+    SNAPSHOT_PATH,
+    SOURCE_COLUMNS,
+    dataset_version,
+    load_dataset,
+    aggregate_flights,
+    load_snapshot,
+)
+from dashboard.figure_cache import FigureCache
+
+logger = logging.getLogger(__name__)
+
+# Sidebar width, navigation buttons and collapse-button styling
+SIDEBAR_STYLE = """
+<style>
+    /* --- SIDEBAR WIDTH --- */
+    [data-testid="stSidebar"] {
+        width: 260px !important;
+        min-width: 260px !important;
+        background-color: #f7f9fc;
+        padding-top: 20px;
+    }
+
+    .sidebar-title {
+        font-size: 22px;
+        font-weight: 700;
+        color: #0056D2;
+        margin-bottom: 15px;
+    }
+
+    /* --- REMOVE ONLY THE RADIO DOT --- */
+    [data-testid="stRadioOption"] > div:first-child {
+        display: none !important;
+    }
+
+    /* --- STYLE RADIO LABEL BLOCKS --- */
+    div[role="radiogroup"] > label {
+        width: 100% !important;
+        background: #ffffff !important;
+        padding: 12px 16px !important;
+        margin: 6px 0 !important;
+        border-radius: 10px !important;
+        border: 1px solid #dce3ee !important;
+        cursor: pointer !important;
+        transition: all 0.25s ease !important;
+
+        display: flex !important;
+        align-items: center !important;
+        justify-content: flex-start !important;
+        gap: 10px !important;
+    }
+
+    /* --- TEXT STYLING --- */
+    div[role="radiogroup"] > label p {
+        margin: 0 !important;
+        padding: 0 !important;
+        color: #1a1a1a !important;
+        font-size: 15px !important;
+        font-weight: 600 !important;
+    }
+
+    /* --- HOVER EFFECT --- */
+    div[role="radiogroup"] > label:hover {
+        background-color: #eef4ff !important;
+        border-color: #b7c8ff !important;
+        color: #003b91 !important;
+    }
+
+    /* --- ACTIVE / SELECTED ITEM --- */
+    div[role="radiogroup"] > label[aria-checked="true"] {
+        background-color: #0056D2 !important;
+        color: white !important;
+        border: 1px solid #0041a8 !important;
+    }
+
+    div[role="radiogroup"] > label[aria-checked="true"] p {
+        color: white !important;
+        font-weight: 700 !important;
+    }
+
+    /* 1) Force collapse button to always be visible */
+    [data-testid="stSidebarCollapseButton"],
+    [data-testid="stSidebarCollapseButton"] button,
+    [data-testid="stSidebarCollapseButton"] button[class*="st-emotion-cache-"] {
+        opacity: 1 !important;
+        # background: transparent !important;
+        color: #000 !important;
+        box-shadow: none !important;
+        border: none !important;
+    }
+
+    /* 2) Force the arrow icon (svg + path) to be BLACK */
+    [data-testid="stSidebarCollapseButton"] svg,
+    [data-testid="stSidebarCollapseButton"] svg path {
+        stroke: #000 !important;
+        opacity: 1 !important;
+    }
+
+    /* 3) Disable hover fade or highlight */
+    [data-testid="stSidebarCollapseButton"]:hover,
+    [data-testid="stSidebarCollapseButton"] button:hover {
+        background: transparent !important;
+        opacity: 1 !important;
+        box-shadow: none !important;
+    }
+
+</style>
+"""
+
+# Research-question header number, hypothesis card and status line
+RQ_STYLE = """
+    <style>
+        .rq-header {
+            display: flex;
+            align-items: center;
+            font-size: 24px;
+            font-weight: 600;
+            margin-bottom: 15px;
+        }
+        .rq-number {
+            background-color: #0056D2;
+            color: white;
+            font-size: 20px;
+            font-weight: bold;
+            padding: 6px 14px;
+            border-radius: 50%;
+            margin-right: 10px;
+        }
+        .hyp-card {
+            background-color: #f8f9fb;
+            border: 1px solid #d1d9e6;
+            padding: 18px 20px;
+            border-radius: 12px;
+            margin-top: 10px;
+            margin-bottom: 20px;
+        }
+        .hyp-card p {
+            color: #333333;      
+            font-size: 16px;
+            line-height: 1.5;
+        }
+        .hyp-title {
+            font-size: 18px;
+            font-weight: 600;
+            margin-bottom: 8px;
+            color: #000000;      
+        }
+        .hyp-status {
+            color: #1BA94C;
+            font-weight: 600;
+            margin-top: 15px;
+            display: flex;
+            align-items: center;
+        }
+        .hyp-status-icon {
+            font-size: 20px;
+            margin-right: 6px;
+        }
+    </style>
+"""
+
+
+@st.cache_resource(max_entries=1)
+def _load_flights_dataset(source):
+    if source[0] == "snapshot":
+        try:
+            return load_snapshot(source[1])
+        except ValueError as error:
+            # Written by another code, pandas or numpy version: serve the CSV
+            # until the snapshot is rebuilt rather than failing every page
+            logger.warning("Ignoring the snapshot, loading the CSV instead: %s", error)
+    return load_dataset()
+
+
+def flights_dataset():
+    # One read-only dataset shared by all sessions and the warm-up thread: the
+    # typed cleaned data, its derived booking_window column and aggregates,
+    # mapped from a file that every worker process on the host shares. It
+    # comes from the snapshot built by `python -m dashboard.snapshot` when one
+    # exists, without touching the CSV; otherwise from the CSV, keyed by its
+    # content hash (rehashed only when its size or mtime changes). Either way,
+    # replacing the file loads the new data on the next rerun.
+    if os.path.exists(SNAPSHOT_PATH):
+        stat = os.stat(SNAPSHOT_PATH)
+        return _load_flights_dataset(("snapshot", SNAPSHOT_PATH, stat.st_size, stat.st_mtime_ns))
+    return _load_flights_dataset(("csv", dataset_version()))
+
+
+# Memory budget of the figure cache shared by all sessions
+FIGURE_CACHE_BYTES = 64 << 20
+
+
+@st.cache_resource
+def figure_cache():
+    # One process-wide cache, so a figure built for one session is reused by all
+    return FigureCache(max_bytes=FIGURE_CACHE_BYTES)
+
+
+def cached_figure(build):
+    # Decorator for a page's figure builders, build(dataset, *args, **inputs).
+    # The result is cached under (module, builder, dataset version, args), so
+    # positional arguments must be hashable widget values; repeat views skip
+    # both the aggregation and the figure construction. Keyword inputs (masks,
+    # crossfilter groups) are only used on a miss and must follow from the
+    # positional arguments. Callers must not modify what they get back.
+    @functools.wraps(build)
+    def cached(dataset, *args, **inputs):
+        key = (build.__module__, build.__qualname__, dataset.version, args)
+        with timing.span(f"figure.{build.__name__}", cached=True) as span:
+            def miss():
+                # Aggregations inside are timed as spans of their own; the
+                # rest of the build is the Plotly figure construction
+                span.note(cached=False)
+                return build(dataset, *args, **inputs)
+            return figure_cache().get(key, miss)
+    return cached
+
+
+def plotly_chart(fig, **kwargs):
+    # st.plotly_chart, timed: it serialises the figure to JSON for the browser
+    with timing.span("plotly_chart"):
+        return st.plotly_chart(fig, **kwargs)
+
+
+# Bin widths (in days) offered on the price-trend charts
+BIN_WIDTHS = [1, 3, 5, 7, 14]
+DEFAULT_BIN_WIDTH = 5
+
+def bin_width_slider(key):
+    # Any width is read off the cube's running totals in O(bins), so the
+    # slider costs the same as the fixed 5-day chart did
+    return st.select_slider(
+        "Bin width (days):",
+        options=BIN_WIDTHS,
+        value=DEFAULT_BIN_WIDTH,
+        key=key
+    )
+
+
+# Ways of picking points on a chart that filters the rest of its page
+BRUSH_MODES = ("points", "box", "lasso")
+
+def crossfilter(dataset, key, dimensions):
+    # One Crossfilter per session and page, rebuilt whenever the sidebar
+    # filters hand the page a different dataset. Its per-row arrays are
+    # shared through the dataset; the session only holds the filter bits
+    cf = st.session_state.get(key)
+    if cf is None or cf.dataset is not dataset:
+        cf = Crossfilter(dataset, dimensions)
+        st.session_state[key] = cf
+    return cf
+
+
+# Key suffixes of the value widgets (selectboxes, sliders, radios) inside tabs
+TAB_WIDGET_SUFFIXES = ("_airline", "_class", "_stops", "_bin_width", "_export_format")
+
+def keep_tab_widget_state():
+    # Closed tabs are not drawn, and Streamlit drops the state of widgets that
+    # a run does not draw; re-assigning their values keeps each tab's choices
+    for key in list(st.session_state):
+        if key.startswith("rq") and key.endswith(TAB_WIDGET_SUFFIXES):
+            st.session_state[key] = st.session_state[key]
+
+
+def brushed_points(chart_key, dataset):
+    # Points picked on a chart drawn with on_select="rerun". They are copied to
+    # "<key>_points", so the selection outlives runs in which the chart's tab
+    # is closed (and its own state dropped); deselecting on the chart or
+    # clear_brushes() removes them. They are also dropped when the sidebar
+    # filters hand the page another dataset: they were picked on a chart of
+    # other rows, and may match none of the new ones.
+    saved = f"{chart_key}_points"
+    live = f"{chart_key}_live"
+    version = f"{chart_key}_version"
+    event = st.session_state.get(chart_key)
+    points = None if event is None else event["selection"]["points"]
+    if st.session_state.get(version) != dataset.version:
+        st.session_state[version] = dataset.version
+        _drop_brush(chart_key)
+    if points is None:
+        st.session_state[live] = False
+    elif points != st.session_state.get(f"{chart_key}_stale"):
+        # The chart keeps reporting a dropped selection until it changes
+        st.session_state.pop(f"{chart_key}_stale", None)
+        if points or st.session_state.get(live):
+            st.session_state[saved] = points
+        st.session_state[live] = bool(points)
+    return st.session_state.get(saved, [])
+
+
+def _drop_brush(chart_key):
+    # Forget the saved points, and ignore the chart's current selection
+    event = st.session_state.get(chart_key)
+    st.session_state.pop(f"{chart_key}_points", None)
+    st.session_state[f"{chart_key}_stale"] = None if event is None else event["selection"]["points"]
+
+
+def clear_brushes(*chart_keys):
+    # on_click callback of the "Clear selection" buttons
+    for key in chart_keys:
+        _drop_brush(key)
+
+
+def brushed_days(chart_key, dataset):
+    # Every day covered by the bins picked on a price-trend chart (None if none)
+    points = brushed_points(chart_key, dataset)
+    if not points:
+        return None
+    days = set()
+    for point in points:
+        first, last = days_bin_days(point["x"])
+        days.update(range(first, last + 1))
+    return sorted(days)
+
+
+def selection_mask(dataset, where=None, mask=None):
+    # Rows of the dataset matching `where` (column -> value) and a boolean
+    # `mask`, as a mask over the whole shared frame; None for all its rows
+    if not where:
+        return dataset.row_mask if mask is None else mask
+    if mask is None:
+        return dataset.mask(**where)
+    return dataset.mask(**where) & mask
+
+
+def export_controls(dataset, key, where=None, table=None, mask=None):
+    # Download buttons for the rows selected by `where` (column -> value) and
+    # `mask`, and for the chart's aggregated table. Nothing is serialised until
+    # a click; rows are streamed out of the shared frame in chunks, never copied whole.
+    with st.expander("📤 Export the data behind this chart"):
+        fmt = st.radio(
+            "Format:",
+            downloads.EXPORT_FORMATS,
+            horizontal=True,
+            key=f"{key}_export_format"
+        )
+        ext, mime = downloads.FORMATS[fmt]
+
+        st.download_button(
+            label="Download filtered rows",
+            data=lambda: downloads.export_rows(
+                dataset.base.frame,
+                selection_mask(dataset, where, mask),
+                fmt,
+                SOURCE_COLUMNS
+            ),
+            file_name=f"{key}_rows{ext}",
+            mime=mime,
+            on_click="ignore",
+            key=f"{key}_export_rows"
+        )
+
+        if table is not None:
+            st.download_button(
+                label="Download aggregated table",
+                data=lambda: downloads.export_table(table, fmt),
+                file_name=f"{key}_table{ext}",
+                mime=mime,
+                on_click="ignore",
+                key=f"{key}_export_table"
+            )
+
+
+def timing_panel(trace):
+    # Developer panel (FLIGHTS_TIMING=1) with this rerun's spans, their time
+    # net of nested spans, and the counters of the process-wide caches
+    with st.sidebar.expander("⏱️ Timings"):
+        st.caption(f"Rerun: {trace.duration * 1000:.1f} ms")
+        rows = []
+        for i, span in enumerate(trace.spans):
+            nested = 0.0
+            for inner in trace.spans[i + 1:]:
+                if inner.depth <= span.depth:
+                    break
+                if inner.depth == span.depth + 1:
+                    nested += inner.duration
+            rows.append({
+                "span": "· " * span.depth + span.name,
+                "ms": round(span.duration * 1000, 2),
+                "self ms": round((span.duration - nested) * 1000, 2),
+                **{k: str(v) for k, v in span.attrs.items()},
+            })
+        st.dataframe(rows, hide_index=True)
+        st.caption("Figure cache")
+        st.json(figure_cache().stats(), expanded=False)
+        st.caption("Aggregates")
+        st.json(aggregate_flights.stats(), expanded=False)
@@ -0,0 +1,343 @@
+"""Overview page: dataset downloads, headline metrics, pies and histograms."""
+import streamlit as st
+import plotly.express as px
+
+from dashboard.charts import histogram_figure
+from dashboard.distributions import coarsen_histogram
+from dashboard import downloads
+from dashboard.data import CLEANED_CSV, RAW_CSV
+from views.common import cached_figure, plotly_chart
+
+# Choices of the pie chart and distribution dropdowns
+PIE_OPTIONS = ["Flights by Airline", "Flight Classes", "Number of Stops"]
+DISTRIBUTION_OPTIONS = ["Ticket Price Distribution", "Days Left Distribution"]
+
+# Bin counts offered on the distribution chart
+HISTOGRAM_BINS = [10, 20, 30, 40, 60, 80, 120, 240]
+DEFAULT_HISTOGRAM_BINS = 40
+
+
+@cached_figure
+def pie_figure(dataset, pie_option):
+    # Share of flights by airline, class or number of stops
+    cube = dataset.cube
+
+    # ---------------------- AIRLINE PIE CHART ----------------------
+    if pie_option == "Flights by Airline":
+        airline_counts = cube.rollup(['airline'])[['airline', 'count']]
+        airline_counts.columns = ['Airline', 'Count']
+
+        fig = px.pie(
+            airline_counts,
+            names='Airline',
+            values='Count',
+            title='Distribution of Flights by Airline',
+            hole=0.3
+        )
+
+        fig.update_traces(
+            hovertemplate="<b>%{label}</b><br>Flights: %{value}<br>Percentage: %{percent}"
+        )
+
+
+    # ---------------------- CLASS PIE CHART ----------------------
+    elif pie_option == "Flight Classes":
+        class_counts = cube.rollup(['class'])[['class', 'count']]
+        class_counts.columns = ['Class', 'Count']
+
+        fig = px.pie(
+            class_counts,
+            names='Class',
+            values='Count',
+            title='Distribution of Flight Classes',
+            hole=0.3
+        )
+
+        fig.update_traces(
+            hovertemplate="<b>%{label}</b><br>Total Flights: %{value}<br>Percentage: %{percent}"
+        )
+
+
+    # ---------------------- STOPS PIE CHART ----------------------
+    elif pie_option == "Number of Stops":
+        stops_counts = cube.rollup(['stops'])[['stops', 'count']]
+        stops_counts.columns = ['Stops', 'Count']
+        stops_counts['Stops'] = stops_counts['Stops'].astype(str)
+
+        fig = px.pie(
+            stops_counts,
+            names='Stops',
+            values='Count',
+            title='Distribution of Number of Stops',
+            hole=0.3
+        )
+
+        fig.update_traces(
+            hovertemplate="<b>%{label} Stops</b><br>Total Flights: %{value}<br>Percentage: %{percent}"
+        )
+
+    return fig
+
+
+@cached_figure
+def distribution_figure(dataset, chart_option, nbins):
+    # Histogram of ticket prices or days left, merged down to at most `nbins`
+    # equal bins (whole days for days left)
+    summary = dataset.summary
+
+    # Pre-compute metrics for hover tooltips
+    price_mean = summary['price_mean']
+    price_min = summary['price_min']
+    price_max = summary['price_max']
+    
+    days_mean = summary['days_mean']
+    days_min = summary['days_min']
+    days_max = summary['days_max']
+
+    # -------------------------------
+    # 1️⃣ Ticket Price Histogram
+    # -------------------------------
+    if chart_option == "Ticket Price Distribution":
+        counts, edges = coarsen_histogram(*dataset.histogram('price'), nbins)
+
+        fig = histogram_figure(
+            counts,
+            edges,
+            x='price',
+            title='Distribution of Ticket Prices',
+            color='#1f77b4',  # blue
+            opacity=0.85,
+        )
+
+        # Add visible bar boundaries
+        fig.update_traces(
+            marker_line_width=1.2,
+            marker_line_color='black',
+            hovertemplate=(
+                "<b>Price: %{x}</b><br>"
+                "Count: %{y}<br><br>"
+                f"Avg Price: ₹{price_mean:,.0f}<br>"
+                f"Min Price: ₹{price_min:,.0f}<br>"
+                f"Max Price: ₹{price_max:,.0f}<br>"
+            )
+        )
+
+
+
+    # -------------------------------
+    # 2️⃣ Days Left Histogram
+    # -------------------------------
+    elif chart_option == "Days Left Distribution":
+        counts, edges = coarsen_histogram(*dataset.histogram('days_left'), nbins)
+
+        fig = histogram_figure(
+            counts,
+            edges,
+            x='days_left',
+            title='Distribution of Days Left Before Departure',
+            color='#2ca02c',  # green
+            opacity=0.85,
+        )
+
+        # Add visible bar boundaries  
+        fig.update_traces(
+            marker_line_width=1.2,
+            marker_line_color='black',
+            hovertemplate=(
+                "<b>Days Left: %{x}</b><br>"
+                "Count: %{y}<br><br>"
+                f"Avg Days Left: {days_mean:.1f}<br>"
+                f"Min Days Left: {days_min}<br>"
+                f"Max Days Left: {days_max}<br>"
+            )
+        )
+
+    return fig
+
+
+def warm_up(dataset):
+    # Every pie and distribution at the default bin count
+    for pie_option in PIE_OPTIONS:
+        pie_figure(dataset, pie_option)
+    for chart_option in DISTRIBUTION_OPTIONS:
+        distribution_figure(dataset, chart_option, DEFAULT_HISTOGRAM_BINS)
+
+
+def render(dataset):
+    st.title("✈️ Air Ticket Price Analysis Dashboard")
+    st.markdown("""
+    This dashboard provides insights into air ticket pricing patterns using data from **Kaggle**.
+    We explore various factors like **airline**, **class**, **stops**, and **days_left** before departure to understand
+    how they influence ticket prices.
+    """)
+
+    # -----------------------------
+    # 📥 DATA DOWNLOAD DROPDOWN
+    # -----------------------------
+    st.subheader("📥 Download Dataset")
+
+    download_option = st.selectbox(
+        "Choose a dataset to download:",
+        ["Select an option", "Raw Dataset", "Cleaned Dataset"]
+    )
+
+    if download_option != "Select an option":
+        download_format = st.radio(
+            "Format:",
+            list(downloads.FORMATS),
+            horizontal=True
+        )
+
+        # Files are built once per source content hash and shared by every
+        # session; nothing is read until the button is clicked
+        csv_path = RAW_CSV if download_option == "Raw Dataset" else CLEANED_CSV
+        st.download_button(
+            label=f"Download {download_option}",
+            data=downloads.opener(csv_path, download_format),
+            file_name=downloads.download_file_name(csv_path, download_format),
+            mime=downloads.FORMATS[download_format][1],
+            on_click="ignore"
+        )
+
+
+    #CUSTOM CSS FOR CARDS
+    st.markdown("""
+    <style>
+    .metric-card {
+        background-color: #ffffff;
+        padding: 20px 25px;
+        border-radius: 12px;
+        border: 1px solid #e0e0e0;
+        box-shadow: 0px 2px 8px rgba(0,0,0,0.07);
+        text-align: center;
+
+        height: 150px;              
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+        align-items: center;
+
+        margin-bottom: 20px;        
+    }
+    .metric-card h3 {
+        font-size: 18px;
+        margin-bottom: 6px;
+        color: #333;
+    }
+    .metric-card p {
+        font-size: 22px;
+        font-weight: 600;
+        color: #1a73e8;
+        margin: 0;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+
+    # 📊 METRIC CARDS
+  
+    st.subheader("Overview")
+
+    # Calculations (all precomputed once when the dataset loads)
+    summary = dataset.summary
+
+    avg_price = summary['price_mean']
+    avg_duration = summary['duration_mean']
+    avg_day_left = summary['days_mean']
+
+    unique_routes = summary['unique_routes']
+
+    cheapest_airline = summary['cheapest_airline']
+    cheapest_price = summary['cheapest_price']
+    expensive_airline = summary['expensive_airline']
+    expensive_price = summary['expensive_price']
+
+    # Display Metric Cards
+    col1, col2, col3 = st.columns(3)
+    col4, col5, col6 = st.columns(3)
+
+    with col1:
+        # Total Records
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>📊 Total Records</h3>
+            <p>{summary['records']:,}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Average Ticket Price (moved from col1 to col2)
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>💸 Average Ticket Price</h3>
+            <p>₹{avg_price:,.0f}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>📅 Average Days Left</h3>
+            <p>{avg_day_left:.1f}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>🛣️ Unique Routes</h3>
+            <p>{unique_routes}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col5:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>💰 Cheapest Airline</h3>
+            <p>{cheapest_airline}<br>₹{cheapest_price:,.0f}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col6:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>🔥 Pricest Airline</h3>
+            <p>{expensive_airline}<br>₹{expensive_price:,.0f}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+    # -----------------------------
+    # 📂 Overview Visualization
+    # -----------------------------
+
+    st.subheader("Overview Visualizations")
+
+    # Dropdown selection
+    pie_option = st.selectbox(
+        "Select a Pie Chart to View:",
+        PIE_OPTIONS
+    )
+
+    fig = pie_figure(dataset, pie_option)
+
+    plotly_chart(fig, use_container_width=True)
+
+    # Dropdown  
+    chart_option = st.selectbox(
+        "📊 Select Distribution to View",
+        DISTRIBUTION_OPTIONS
+    )
+
+    # Bin counts are merged from a fine histogram computed once per dataset,
+    # so changing them never rescans the rows
+    nbins = st.select_slider(
+        "Number of bins",
+        options=HISTOGRAM_BINS,
+        value=DEFAULT_HISTOGRAM_BINS
+    )
+
+    fig = distribution_figure(dataset, chart_option, nbins)
+
+    plotly_chart(fig, use_container_width=True)
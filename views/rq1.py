@@ -0,0 +1,236 @@
+"""Research question 1: days left before departure vs ticket price."""
+import streamlit as st
+import plotly.express as px
+
+from dashboard.charts import box_figure, scatter_or_density
+from dashboard.distributions import box_stats
+from views.common import (
+    BRUSH_MODES,
+    DEFAULT_BIN_WIDTH,
+    RQ_STYLE,
+    bin_width_slider,
+    brushed_days,
+    cached_figure,
+    clear_brushes,
+    crossfilter,
+    export_controls,
+    plotly_chart,
+)
+
+
+@cached_figure
+def days_scatter(dataset, days, rows):
+    # Tab 1: days left vs price, for the selected days (the crossfilter's
+    # `rows`) only if any
+    df = dataset.frame if rows is None else dataset.rows(rows)
+
+    # Scatter for small selections, server-side density image for large ones
+    fig = scatter_or_density(
+        df,   # Always all airlines
+        x='days_left',
+        y='price',
+        color='airline',
+        title="Days Left vs Ticket Price (All Airlines)",
+        opacity=0.7,
+        hover_data=['airline', 'source_city', 'destination_city'],
+        marker=dict(size=8, line=dict(width=0.5, color='black'))
+    )
+
+    fig.update_layout(xaxis_title="Days Left", yaxis_title="Ticket Price")
+
+    return fig
+
+
+@cached_figure
+def price_trend(dataset, bin_width):
+    # Tab 2: average price per booking-window bin
+    cube = dataset.cube
+
+    # Average price per bin, rolled up from the aggregate cube
+    avg_price_by_bin = (
+        cube.rollup(['days_bin'], days_bin=bin_width)
+        .rename(columns={'days_bin': 'Days_Bin', 'mean': 'price'})
+    )
+
+    fig = px.line(
+        avg_price_by_bin,
+        x='Days_Bin',
+        y='price',
+        markers=True,
+        title=f"Price Trend Across All Airlines ({bin_width}-Day Booking Windows)"
+    )
+
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
+    fig.update_xaxes(showline=True, linewidth=2)
+    fig.update_yaxes(showline=True, linewidth=2)
+    fig.update_layout(
+        xaxis_title=f"Days Left ({bin_width}-Day Bins)",
+        yaxis_title="Average Ticket Price",
+        xaxis_tickangle=45
+    )
+
+    return fig, avg_price_by_bin
+
+
+@cached_figure
+def days_box(dataset, days, rows):
+    # Tab 3: booking-window box plot, for the selected days (the crossfilter's
+    # `rows`) only if any
+
+    # Quartiles, whiskers, mean and capped outliers are computed on the
+    # server; the unselected case is cached on the dataset
+    stats = dataset.box_stats() if rows is None else box_stats(dataset.rows(rows))
+    fig = box_figure(
+        stats,
+        x='booking_window',
+        title="Price Distribution Across All Airlines by Booking Window"
+    )
+
+    fig.update_layout(
+        xaxis_title="Days Left Category",
+        yaxis_title="Ticket Price",
+        showlegend=False
+    )
+
+    fig.update_xaxes(showline=True, linewidth=2, linecolor="black")
+    fig.update_yaxes(showline=True, linewidth=2, linecolor="black")
+
+    return fig, stats
+
+
+def warm_up(dataset):
+    # Every tab with nothing selected and the default bin width
+    days_scatter(dataset, None, rows=None)
+    price_trend(dataset, DEFAULT_BIN_WIDTH)
+    days_box(dataset, None, rows=None)
+
+
+def render(dataset):
+    # ===============================
+    # 1️⃣ STYLE THE RESEARCH QUESTION HEADER
+
+    st.markdown(RQ_STYLE, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 2️⃣ HEADER BLOCK (Fix: ensure no stray characters)
+    # ===============================
+    st.markdown("""
+        <div class='rq-header'>
+            <div class='rq-number'>1</div>
+            How does the number of days left before departure affect flight ticket?
+        </div>
+    """, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 3️⃣ FIXED HYPOTHESIS DISPLAY
+    # ===============================
+    st.markdown("""
+        <div class="hyp-card">
+            <div class="hyp-title">Hypothesis</div>
+            <p>Flights booked closer to the departure date are significantly more expensive than those booked well in advance.</p>
+            <div class="hyp-status">
+                <span class="hyp-status-icon">✔️</span>
+                Hypothesis Supported
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 🔗 LINKED SELECTION
+    # ===============================
+    # Bins picked on the trend chart (tab 2) filter the scatter and box plot
+    days = brushed_days("rq1_tab2_chart", dataset)
+    cf = crossfilter(dataset, "rq1_crossfilter", ["days_left"])
+    cf.filter("days_left", days)
+    brushed = cf.mask() if cf.is_filtered("days_left") else None
+
+    # The scatter and box plot are cached per set of selected days; on a miss
+    # they are drawn from the crossfilter's mask
+    selected_days = None if days is None else tuple(days)
+    # The windows picked may hold no flights under the page's other filters
+    nothing_brushed = brushed is not None and not brushed.any()
+
+    if brushed is not None:
+        if nothing_brushed:
+            st.warning("No flights fall in the booking windows selected on the trend chart.")
+        else:
+            st.info(
+                f"Showing the {brushed.sum():,} flights in the booking windows selected "
+                "on the trend chart."
+            )
+        st.button("Clear selection", on_click=clear_brushes, args=("rq1_tab2_chart",), key="rq1_clear")
+
+    # ===============================
+    # 4️⃣ VISUALIZATIONS
+    # ===============================
+    # Only the open tab is computed; the others run once they are selected
+    tab1, tab2, tab3 = st.tabs([
+        "Booking Time vs Ticket Price",
+        "How Price Changes as the Trip Gets Closer",
+        "Price Distribution by Booking Window"
+    ], key="rq1_tabs", on_change="rerun")
+
+    # ---------------------------
+    # ⭐ TAB 1: SCATTER (All Airlines)
+    # ---------------------------
+    if tab1.open:
+        with tab1:
+
+            if nothing_brushed:
+                st.info("Nothing to show: clear the selection or pick other booking windows.")
+            else:
+                fig = days_scatter(dataset, selected_days, rows=brushed)
+
+                plotly_chart(fig, use_container_width=True)
+
+                export_controls(dataset, "rq1_tab1", mask=brushed)
+
+
+    # ---------------------------
+    # ⭐ TAB 2: LINE TREND (All Airlines)
+    # ---------------------------
+    if tab2.open:
+        with tab2:
+
+            st.subheader("Average Price Trend as Departure Gets Closer")
+
+            bin_width = bin_width_slider("rq1_tab2_bin_width")
+
+            fig, avg_price_by_bin = price_trend(dataset, bin_width)
+
+            plotly_chart(
+                fig,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode=BRUSH_MODES,
+                key="rq1_tab2_chart"
+            )
+            st.caption("Select points on this chart to filter the other tabs.")
+
+            export_controls(dataset, "rq1_tab2", table=avg_price_by_bin)
+
+
+    # ---------------------------
+    # ⭐ TAB 3: BOX PLOT (All Airlines)
+    # ---------------------------
+
+    if tab3.open:
+        with tab3:
+
+            st.subheader("Ticket Price Distribution by Booking Window")
+
+            if nothing_brushed:
+                st.info("Nothing to show: clear the selection or pick other booking windows.")
+            else:
+                fig, stats = days_box(dataset, selected_days, rows=brushed)
+
+                plotly_chart(fig, use_container_width=True)
+
+                export_controls(dataset, "rq1_tab3", table=stats.drop(columns="outliers"), mask=brushed)
+
+    st.markdown(
+        "**Insight:** Ticket prices rise sharply when fewer days are left — supporting the hypothesis."
+    )
@@ -0,0 +1,266 @@
+"""Research question 2: how the days-left effect differs between airlines."""
+import streamlit as st
+import plotly.express as px
+
+from dashboard.charts import box_figure, scatter_or_density
+from views.common import (
+    DEFAULT_BIN_WIDTH,
+    RQ_STYLE,
+    bin_width_slider,
+    cached_figure,
+    export_controls,
+    plotly_chart,
+)
+
+
+@cached_figure
+def airline_scatter(dataset, airline):
+    # Tab 1: days left vs price for one airline (or all of them)
+    df = dataset.frame
+
+    # Filter dataframe
+    if airline == "All Airlines":
+        df_filtered = df
+    else:
+        df_filtered = dataset.rows(dataset.mask(airline=airline))
+
+    # Scatter plot (density image when too many points)
+    fig = scatter_or_density(
+        df_filtered,
+        x='days_left',
+        y='price',
+        color=None if airline != "All Airlines" else "airline",
+        title=(
+            f"Days Left vs Ticket Price ({airline})"
+            if airline != "All Airlines"
+            else "Days Left vs Ticket Price (All Airlines)"
+        ),
+        opacity=0.7,
+        hover_data=['airline', 'source_city', 'destination_city'],
+        marker=dict(size=8, line=dict(width=0.5, color='black'))
+    )
+
+    fig.update_layout(
+        xaxis_title="Days Left Before Departure",
+        yaxis_title="Ticket Price"
+    )
+
+    fig.update_xaxes(showline=True, linewidth=2)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    return fig
+
+
+@cached_figure
+def airline_trend(dataset, airline, bin_width):
+    # Tab 2: average price per booking-window bin for one airline (or all)
+    cube = dataset.cube
+    where = {} if airline == "All Airlines" else {"airline": airline}
+
+    # Average price per bin, rolled up from the aggregate cube
+    avg_price_by_bin = (
+        cube.rollup(['days_bin'], where=where, days_bin=bin_width)
+        .rename(columns={'days_bin': 'Days_Bin', 'mean': 'price'})
+    )
+
+    # Line plot
+    fig = px.line(
+        avg_price_by_bin,
+        x='Days_Bin',
+        y='price',
+        markers=True,
+        title=(
+            f"Price Trend for {airline} ({bin_width}-Day Booking Windows)"
+            if airline != "All Airlines"
+            else f"Price Trend Across All Airlines ({bin_width}-Day Booking Windows)"
+        )
+    )
+
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
+    fig.update_xaxes(showline=True, linewidth=2, linecolor="black")
+    fig.update_yaxes(showline=True, linewidth=2, linecolor="black")
+
+    fig.update_layout(
+        xaxis_title=f"Days Left ({bin_width}-Day Bins)",
+        yaxis_title="Average Ticket Price",
+        xaxis_tickangle=45
+    )
+
+    return fig, avg_price_by_bin
+
+
+@cached_figure
+def airline_box(dataset, airline):
+    # Tab 3: booking-window box plot for one airline (or all)
+    # Box statistics for the selection, cached per airline on the dataset
+    stats = dataset.box_stats(
+        None if airline == "All Airlines" else airline
+    )
+
+    # --------------------------
+    # PLOTLY BOXPLOT
+    # --------------------------
+    fig = box_figure(
+        stats,
+        x="booking_window",
+        title=(
+            f"Price Distribution for {airline} Across Booking Windows"
+            if airline != "All Airlines"
+            else "Price Distribution Across All Airlines by Booking Window"
+        )
+    )
+
+    fig.update_layout(
+        xaxis_title="Days Left Category",
+        yaxis_title="Ticket Price",
+        showlegend=False
+    )
+
+    # Clear axis lines
+    fig.update_xaxes(showline=True, linewidth=2, linecolor="black")
+    fig.update_yaxes(showline=True, linewidth=2, linecolor="black")
+
+    return fig, stats
+
+
+def warm_up(dataset):
+    # Every tab for every airline, at the default bin width
+    for airline in ["All Airlines"] + sorted(dataset.cube.values('airline')):
+        airline_scatter(dataset, airline)
+        airline_trend(dataset, airline, DEFAULT_BIN_WIDTH)
+        airline_box(dataset, airline)
+
+
+def render(dataset):
+    cube = dataset.cube
+
+    # ===============================
+    # 1️⃣ STYLE THE RESEARCH QUESTION HEADER
+    # ===============================
+    st.markdown(RQ_STYLE, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 2️⃣ HEADER BLOCK (Fix: ensure no stray characters)
+    # ===============================
+    st.markdown("""
+        <div class='rq-header'>
+            <div class='rq-number'>2</div>
+            Does the effect of days left on ticket prices vary across different airlines?
+        </div>
+    """, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 3️⃣ FIXED HYPOTHESIS DISPLAY
+    # ===============================
+    st.markdown("""
+        <div class="hyp-card">
+            <div class="hyp-title">Hypothesis</div>
+            <p>Airlines differ in their pricing strategies, with some showing sharper increases in ticket prices as departure approaches compared to others.</p>
+            <div class="hyp-status">
+                <span class="hyp-status-icon">✔️</span>
+                Hypothesis Supported
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Only the open tab is computed; the others run once they are selected
+    tab1, tab2, tab3 = st.tabs([
+        "How Booking Time Affects Ticket Prices",
+        "Price Trend as the Trip Gets Closer (by Airline)",
+        "Price Distribution Across Booking Windows (by Airline)"
+    ], key="rq2_tabs", on_change="rerun")
+
+    if tab1.open:
+        with tab1:
+
+            st.subheader("How Booking Time Affects Ticket Price for Each Airline")
+
+            # Build dropdown options: first item = "All Airlines"
+            airline_options = ["All Airlines"] + sorted(cube.values('airline'))
+
+            # Default selection: first actual airline (index 1, not "All Airlines")
+            default_index = 1 if len(airline_options) > 1 else 0
+
+            selected_airline = st.selectbox(
+                "Select Airline:",
+                airline_options,
+                index=default_index,
+                key="rq2_tab1_airline"
+            )
+
+            fig = airline_scatter(dataset, selected_airline)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(
+                dataset,
+                "rq2_tab1",
+                where=None if selected_airline == "All Airlines" else {"airline": selected_airline}
+            )
+
+    if tab2.open:
+        with tab2:
+
+            st.subheader("How Ticket Prices Change as the Departure Date Gets Closer")
+
+            # Dropdown
+            airline_options = ["All Airlines"] + sorted(cube.values('airline'))
+            default_index = 1 if len(airline_options) > 1 else 0
+
+            selected_airline_2 = st.selectbox(
+                "Select Airline:",
+                airline_options,
+                index=default_index,
+                key="rq2_tab2_airline"
+            )
+
+            # Apply filter
+            where = {}
+            if selected_airline_2 != "All Airlines":
+                where['airline'] = selected_airline_2
+
+            bin_width = bin_width_slider("rq2_tab2_bin_width")
+
+            fig, avg_price_by_bin = airline_trend(dataset, selected_airline_2, bin_width)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(dataset, "rq2_tab2", where=where, table=avg_price_by_bin)
+    
+    if tab3.open:
+        with tab3:
+
+            st.subheader("How Ticket Prices Vary Across Booking Windows for Each Airline")
+
+            # --------------------------
+            # AIRLINE DROPDOWN (DEFAULT = FIRST AIRLINE)
+            # --------------------------
+            airline_options = ["All Airlines"] + sorted(cube.values("airline"))
+
+            default_index = 1 if len(airline_options) > 1 else 0   # not "All Airlines"
+
+            selected_airline_3 = st.selectbox(
+                "Select Airline:",
+                airline_options,
+                index=default_index,
+                key="rq2_tab3_airline"
+            )
+
+            fig, stats = airline_box(dataset, selected_airline_3)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(
+                dataset,
+                "rq2_tab3",
+                where=None if selected_airline_3 == "All Airlines" else {"airline": selected_airline_3},
+                table=stats.drop(columns="outliers")
+            )
+
+
+    st.markdown(
+        "**Insight:** Some airlines show steeper price increases as the departure date approaches, "
+        "indicating different pricing strategies and supporting the hypothesis."
+    )
@@ -0,0 +1,346 @@
+"""Research question 3: days left vs price for economy and business class."""
+import streamlit as st
+import plotly.express as px
+
+from dashboard.charts import scatter_or_density
+from dashboard.crossfilter import Crossfilter
+from views.common import (
+    BRUSH_MODES,
+    DEFAULT_BIN_WIDTH,
+    RQ_STYLE,
+    bin_width_slider,
+    brushed_days,
+    brushed_points,
+    cached_figure,
+    clear_brushes,
+    crossfilter,
+    export_controls,
+    plotly_chart,
+    selection_mask,
+)
+
+
+@cached_figure
+def class_bar(dataset, days, group):
+    # Tab 1: average price per class, over the selected days if any
+
+    # Average price by class (sorted), kept up to date by the crossfilter
+    avg_price_class = (
+        group.table()
+        .rename(columns={'mean': 'price'})
+        .sort_values('price', ascending=False)
+    )
+
+    # Plotly bar chart
+    fig = px.bar(
+        avg_price_class,
+        x='class',
+        y='price',
+        color='class',
+        title="Average Ticket Price by Flight Class",
+        text_auto='.2s'
+    )
+
+    # Improve bar styling
+    fig.update_traces(
+        marker_line_width=1.2,
+        marker_line_color="black"
+    )
+
+    # Layout adjustments
+    fig.update_layout(
+        xaxis_title="Flight Class",
+        yaxis_title="Average Ticket Price",
+        showlegend=False
+    )
+
+    # Clear axis lines
+    fig.update_xaxes(showline=True, linewidth=2)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    return fig, avg_price_class
+
+
+@cached_figure
+def class_scatter(dataset, selected_class, classes, days, rows):
+    # Tab 2: days left vs price for one class (or all), within the selection
+    df_filtered = dataset.frame if rows is None else dataset.rows(rows)
+
+    # Plotly scatter (density image when too many points)
+    fig = scatter_or_density(
+        df_filtered,
+        x='days_left',
+        y='price',
+        color="class" if selected_class == "All Classes" else None,
+        title=(
+            f"Days Left vs Ticket Price ({selected_class})"
+            if selected_class != "All Classes"
+            else "Days Left vs Ticket Price (All Flight Classes)"
+        ),
+        opacity=0.7,
+        hover_data=['airline', 'source_city', 'destination_city', 'class'],
+        # Marker styling
+        marker=dict(
+            size=8,
+            line=dict(width=0.5, color='black')
+        )
+    )
+
+    # Layout polish
+    fig.update_layout(
+        xaxis_title="Days Left Before Departure",
+        yaxis_title="Ticket Price",
+    )
+
+    # Clean axis lines
+    fig.update_xaxes(showline=True, linewidth=2, linecolor="black")
+    fig.update_yaxes(showline=True, linewidth=2, linecolor="black")
+
+    return fig
+
+
+@cached_figure
+def class_trend(dataset, selected_class_line, bin_width, classes, group):
+    # Tab 3: average price per booking-window bin and class, for the selected
+    # classes if any
+
+    # --------------------------
+    # Mean per bin + class, kept up to date by the crossfilter
+    # --------------------------
+    avg_price_bin = (
+        group.table()
+        .rename(columns={'days_bin': 'Days_Bin', 'mean': 'price'})
+    )
+    if selected_class_line != "All Classes":
+        avg_price_bin = avg_price_bin[avg_price_bin['class'] == selected_class_line]
+
+    # --------------------------
+    # Plotly line graph
+    # --------------------------
+    fig = px.line(
+        avg_price_bin,
+        x='Days_Bin',
+        y='price',
+        color='class' if selected_class_line == "All Classes" else None,
+        markers=True,
+        title=(
+            f"Price Trend for {selected_class_line} ({bin_width}-Day Booking Windows)"
+            if selected_class_line != "All Classes"
+            else f"Price Trend Across Flight Classes ({bin_width}-Day Booking Windows)"
+        )
+    )
+
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
+
+    # Clean axis styling
+    fig.update_xaxes(showline=True, linewidth=2, tickangle=45)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    fig.update_layout(
+        xaxis_title=f"Days Left ({bin_width}-Day Bins)",
+        yaxis_title="Average Ticket Price",
+        legend_title="Flight Class"
+    )
+
+    return fig, avg_price_bin
+
+
+def warm_up(dataset):
+    # Every tab for every class with nothing selected, at the default bin width
+    cf = Crossfilter(dataset, ["class", "days_left"])
+    class_bar(dataset, None, group=cf.group(['class'], dimension='class'))
+    for flight_class in ["All Classes"] + sorted(dataset.cube.values('class')):
+        where = None if flight_class == "All Classes" else {"class": flight_class}
+        class_scatter(dataset, flight_class, None, None, rows=selection_mask(dataset, where))
+        class_trend(
+            dataset,
+            flight_class,
+            DEFAULT_BIN_WIDTH,
+            None,
+            group=cf.group(['days_bin', 'class'], days_bin=DEFAULT_BIN_WIDTH, dimension='days_left')
+        )
+
+
+def render(dataset):
+    cube = dataset.cube
+
+    # ===============================
+    # 1️⃣ STYLE THE RESEARCH QUESTION HEADER
+    # ===============================
+    st.markdown(RQ_STYLE, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 2️⃣ HEADER BLOCK (Fix: ensure no stray characters)
+    # ===============================
+    st.markdown("""
+        <div class='rq-header'>
+            <div class='rq-number'>3</div>
+            How does the relationship between days left and ticket price differ between economy and business class flights?
+        </div>
+    """, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 3️⃣ FIXED HYPOTHESIS DISPLAY
+    # ===============================
+    st.markdown("""
+        <div class="hyp-card">
+            <div class="hyp-title">Hypothesis</div>
+            <p>Business class tickets increase in price more steeply than economy class tickets as the departure date approaches.</p>
+            <div class="hyp-status">
+                <span class="hyp-status-icon">✔️</span>
+                Hypothesis Supported
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # ===============================
+    # 🔗 LINKED SELECTION
+    # ===============================
+    # Bars picked on the class chart (tab 1) and bins picked on the trend chart
+    # (tab 3) filter every other chart on the page; each chart ignores its own
+    # selection, so it keeps showing all of its bars or points
+    classes = [p["x"] for p in brushed_points("rq3_tab1_chart", dataset)] or None
+    days = brushed_days("rq3_tab3_chart", dataset)
+    cf = crossfilter(dataset, "rq3_crossfilter", ["class", "days_left"])
+    cf.filter("class", classes)
+    cf.filter("days_left", days)
+    brushed = cf.mask() if cf.is_filtered("class") or cf.is_filtered("days_left") else None
+
+    # Figures are cached per selection; on a miss they are built from the
+    # crossfilter's groups and mask
+    selected_classes = None if classes is None else tuple(sorted(classes))
+    selected_days = None if days is None else tuple(days)
+
+    if brushed is not None:
+        if brushed.any():
+            st.info(
+                f"Showing the {brushed.sum():,} flights in the classes and booking windows "
+                "selected on the charts below."
+            )
+        else:
+            st.warning("No flights fall in both the classes and the booking windows selected below.")
+        st.button(
+            "Clear selection",
+            on_click=clear_brushes,
+            args=("rq3_tab1_chart", "rq3_tab3_chart"),
+            key="rq3_clear"
+        )
+
+    # Only the open tab is computed; the others run once they are selected
+    tab1, tab2, tab3 = st.tabs([
+        "Average Price by Class", 
+        "Price Trend: Economy vs Business",
+        "Booking Window Price Trend"
+    ], key="rq3_tabs", on_change="rerun")
+
+    if tab1.open:
+        with tab1:
+
+            st.subheader("Average Ticket Price: Economy vs Business Class")
+
+            fig, avg_price_class = class_bar(
+                dataset,
+                selected_days,
+                group=cf.group(['class'], dimension='class')
+            )
+
+            plotly_chart(
+                fig,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode=BRUSH_MODES,
+                key="rq3_tab1_chart"
+            )
+            st.caption("Select bars on this chart to filter the other tabs.")
+
+            export_controls(dataset, "rq3_tab1", table=avg_price_class, mask=cf.mask(exclude="class"))
+
+    if tab2.open:
+        with tab2:
+
+            st.subheader("How Booking Time Affects Ticket Prices by Flight Class")
+
+            # Dropdown options for class
+            class_options = ["All Classes"] + sorted(cube.values('class'))
+
+            # Default = first real class (not "All Classes")
+            default_class_index = 1 if len(class_options) > 1 else 0
+
+            selected_class = st.selectbox(
+                "Select Flight Class:",
+                class_options,
+                index=default_class_index,
+                key="rq3_tab2_class"
+            )
+
+            # Filter data
+            where = None if selected_class == "All Classes" else {"class": selected_class}
+            rows = selection_mask(dataset, where, brushed)
+
+            if rows is not None and not rows.any():
+                # E.g. a class other than the ones picked on the bar chart
+                st.warning("No flights of this class match the selection on the charts.")
+            else:
+                fig = class_scatter(dataset, selected_class, selected_classes, selected_days, rows=rows)
+
+                plotly_chart(fig, use_container_width=True)
+
+                export_controls(dataset, "rq3_tab2", where=where, mask=brushed)
+
+    if tab3.open:
+        with tab3:
+
+            st.subheader("How Ticket Prices Change as Departure Gets Closer (By Class)")
+
+            # --------------------------
+            # Dropdown for selecting class
+            # --------------------------
+            class_options = ["All Classes"] + sorted(cube.values('class'))
+
+            # Default index = first actual class
+            default_class_index = 1 if len(class_options) > 1 else 0
+
+            selected_class_line = st.selectbox(
+                "Select Flight Class:",
+                class_options,
+                index=default_class_index,
+                key="rq3_tab3_class"
+            )
+
+            # --------------------------
+            # Filter by class (if needed)
+            # --------------------------
+            where = {}
+            if selected_class_line != "All Classes":
+                where['class'] = selected_class_line
+
+            bin_width = bin_width_slider("rq3_tab3_bin_width")
+
+            fig, avg_price_bin = class_trend(
+                dataset,
+                selected_class_line,
+                bin_width,
+                selected_classes,
+                group=cf.group(['days_bin', 'class'], days_bin=bin_width, dimension='days_left')
+            )
+
+            plotly_chart(
+                fig,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode=BRUSH_MODES,
+                key="rq3_tab3_chart"
+            )
+            st.caption("Select points on this chart to filter the other tabs.")
+
+            export_controls(
+                dataset,
+                "rq3_tab3",
+                where=where,
+                table=avg_price_bin,
+                mask=cf.mask(exclude="days_left")
+            )
+
+    st.markdown("**Insight:** Business class fares are consistently higher, confirming the hypothesis.")
@@ -0,0 +1,237 @@
+"""Research question 4: number of stops vs ticket price."""
+import streamlit as st
+import plotly.express as px
+
+from dashboard.charts import scatter_or_density
+from views.common import (
+    DEFAULT_BIN_WIDTH,
+    RQ_STYLE,
+    bin_width_slider,
+    cached_figure,
+    export_controls,
+    plotly_chart,
+)
+
+
+@cached_figure
+def stops_bar(dataset):
+    # Tab 1: average price per number of stops
+    cube = dataset.cube
+
+    # Aggregate average prices by stops
+    avg_price_stops = (
+        cube.rollup(['stops'])
+        .rename(columns={'mean': 'price'})
+        .sort_values('price', ascending=False)
+    )
+
+    # Create bar chart
+    fig = px.bar(
+        avg_price_stops,
+        x='stops',
+        y='price',
+        color='stops',
+        title="Average Ticket Price by Number of Stops",
+        text_auto='.2s'
+    )
+
+    # Improve bar appearance
+    fig.update_traces(
+        marker_line_width=1.2,
+        marker_line_color="black"
+    )
+
+    # Layout styling
+    fig.update_layout(
+        xaxis_title="Number of Stops",
+        yaxis_title="Average Price",
+        showlegend=False
+    )
+
+    # Sharp axis lines for clarity
+    fig.update_xaxes(showline=True, linewidth=2, tickangle=0)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    return fig, avg_price_stops
+
+
+@cached_figure
+def stops_scatter(dataset, stops):
+    # Tab 2: days left vs price for one stop count (or all)
+    df = dataset.frame
+
+    # Filter based on selection
+    if stops == "All Stops":
+        df_plot = df
+        title_text = "Days Left vs Ticket Price (All Stop Categories)"
+    else:
+        df_plot = dataset.rows(dataset.mask(stops=stops))
+        title_text = f"Days Left vs Ticket Price ({stops} Stop(s))"
+
+    # Scatter plot (density image when too many points)
+    fig = scatter_or_density(
+        df_plot,
+        x="days_left",
+        y="price",
+        color="stops",
+        title=title_text,
+        opacity=0.6,
+        hover_data=["airline", "class", "source_city", "destination_city"],
+        marker=dict(size=7, line=dict(width=0.4, color="black"))
+    )
+
+    fig.update_xaxes(showline=True, linewidth=2)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    fig.update_layout(
+        xaxis_title="Days Left Before Departure",
+        yaxis_title="Ticket Price",
+        legend_title="Stops"
+    )
+
+    return fig
+
+
+@cached_figure
+def stops_trend(dataset, bin_width):
+    # Tab 3: average price per booking-window bin and stop count
+    cube = dataset.cube
+
+    # Average price per bin per stop category, from the aggregate cube
+    avg_price_bins = (
+        cube.rollup(["days_bin", "stops"], days_bin=bin_width)
+        .rename(columns={"days_bin": "Days_Bin", "mean": "price"})
+    )
+
+    # Line plot
+    fig = px.line(
+        avg_price_bins,
+        x="Days_Bin",
+        y="price",
+        color="stops",
+        markers=True,
+        title="Average Ticket Price by Booking Window (By Stops)"
+    )
+
+    fig.update_traces(marker=dict(size=8), line=dict(width=3))
+
+    fig.update_xaxes(showline=True, linewidth=2, tickangle=45)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    fig.update_layout(
+        xaxis_title=f"Days Left ({bin_width}-Day Bins)",
+        yaxis_title="Average Ticket Price",
+        legend_title="Number of Stops"
+    )
+
+    return fig, avg_price_bins
+
+
+def warm_up(dataset):
+    # Every tab for every stop count, at the default bin width
+    stops_bar(dataset)
+    for stops in ["All Stops"] + sorted(dataset.cube.values("stops")):
+        stops_scatter(dataset, stops)
+    stops_trend(dataset, DEFAULT_BIN_WIDTH)
+
+
+def render(dataset):
+    cube = dataset.cube
+
+    # ===============================
+    # 1️⃣ STYLE THE RESEARCH QUESTION HEADER
+    # ===============================
+    st.markdown(RQ_STYLE, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 2️⃣ HEADER BLOCK (Fix: ensure no stray characters)
+    # ===============================
+    st.markdown("""
+        <div class='rq-header'>
+            <div class='rq-number'>4</div>
+            Do non-stop flights show different price trends compared to flights with one or more stops as departure approaches?
+        </div>
+    """, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 3️⃣ FIXED HYPOTHESIS DISPLAY
+    # ===============================
+    st.markdown("""
+        <div class="hyp-card">
+            <div class="hyp-title">Hypothesis</div>
+            <p>Non-stop flights exhibit stronger price increases closer to departure than connecting flights.</p>
+            <div class="hyp-status">
+                <span class="hyp-status-icon">❌</span>
+                Hypothesis Not Supported
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Only the open tab is computed; the others run once they are selected
+    tab1, tab2, tab3 = st.tabs([
+        "Average Ticket Price by Number of Stops", 
+        "Booking Time vs Ticket Price (By Number of Stops)",
+        "Price Trend Across Booking Windows (By Stops)"
+    ], key="rq4_tabs", on_change="rerun")
+
+    if tab1.open:
+        with tab1:
+
+            st.subheader("Average Ticket Price by Number of Stops")
+
+            fig, avg_price_stops = stops_bar(dataset)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(dataset, "rq4_tab1", table=avg_price_stops)
+
+    if tab2.open:
+        with tab2:
+
+            st.subheader("Booking Time vs Ticket Price (By Number of Stops)")
+
+            # Dropdown for stop categories
+            stop_options = ["All Stops"] + sorted(cube.values("stops"))
+
+            selected_stop = st.selectbox(
+                "Select Number of Stops:",
+                stop_options,
+                index=0,
+                key="rq4_tab2_stops"
+            )
+
+            fig = stops_scatter(dataset, selected_stop)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(
+                dataset,
+                "rq4_tab2",
+                where=None if selected_stop == "All Stops" else {"stops": selected_stop}
+            )
+
+
+    if tab3.open:
+        with tab3:
+
+            st.subheader("Price Trend Across Booking Windows (By Stops)")
+
+            bin_width = bin_width_slider("rq4_tab3_bin_width")
+
+            fig, avg_price_bins = stops_trend(dataset, bin_width)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(dataset, "rq4_tab3", table=avg_price_bins)
+
+    st.markdown("""
+    **Insight:**
+                
+    - **0-stop (non-stop) flights are the cheapest overall**, consistently showing the lowest ticket prices across booking windows.
+    - **1-stop flights are the most expensive**, with prices noticeably higher than both non-stop and 2+ stop flights.
+    - **Flights with 2 or more stops fall in between**, generally more expensive than non-stop flights but cheaper than 1-stop flights.
+    - As the departure date approaches, **prices increase for all stop categories**, but the rise is **steeper for 1-stop flights**.
+    - Non-stop flights also increase in price closer to departure, but **not as sharply** as 1-stop flights.
+    """)
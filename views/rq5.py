@@ -0,0 +1,252 @@
+"""Research question 5: airline, class and stops together."""
+import streamlit as st
+import plotly.express as px
+
+from views.common import (
+    DEFAULT_BIN_WIDTH,
+    RQ_STYLE,
+    bin_width_slider,
+    cached_figure,
+    export_controls,
+    plotly_chart,
+)
+
+
+@cached_figure
+def airline_class_bar(dataset):
+    # Tab 1: average price per airline and class
+    cube = dataset.cube
+
+    # Mean price by airline and class, from the aggregate cube
+    avg_price_airline_class = (
+        cube.rollup(['airline', 'class'])
+        .rename(columns={'mean': 'price'})
+    )
+
+    # Plotly grouped bar chart
+    fig = px.bar(
+        avg_price_airline_class,
+        x='airline',
+        y='price',
+        color='class',
+        barmode='group',
+        title="Average Ticket Price by Airline and Class",
+        text_auto='.2s'
+    )
+
+    # Improve bar appearance
+    fig.update_traces(marker_line_width=1.2, marker_line_color="black")
+
+    # Layout polish
+    fig.update_layout(
+        xaxis_title="Airline",
+        yaxis_title="Average Price",
+        legend_title="Flight Class"
+    )
+
+    # Clear axis lines
+    fig.update_xaxes(showline=True, linewidth=2, tickangle=45)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    return fig, avg_price_airline_class
+
+
+@cached_figure
+def stops_class_bar(dataset):
+    # Tab 2: average price per stop count and class
+    cube = dataset.cube
+
+    # Mean price grouped by stops × class, from the aggregate cube
+    avg_price_stops_class = (
+        cube.rollup(['stops', 'class'])
+        .rename(columns={'mean': 'price'})
+    )
+
+    # Plotly grouped bar chart
+    fig = px.bar(
+        avg_price_stops_class,
+        x='stops',
+        y='price',
+        color='class',
+        barmode='group',
+        title="Average Ticket Price by Stops and Class",
+        text_auto='.2s',
+        color_discrete_sequence=px.colors.qualitative.Set2  # nice soft colors
+    )
+
+    # Improve bar appearance
+    fig.update_traces(marker_line_width=1.2, marker_line_color="black")
+
+    # Layout polish
+    fig.update_layout(
+        xaxis_title="Number of Stops",
+        yaxis_title="Average Price",
+        legend_title="Flight Class"
+    )
+
+    # Clear axis lines
+    fig.update_xaxes(showline=True, linewidth=2, tickangle=0)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    return fig, avg_price_stops_class
+
+
+@cached_figure
+def airline_trend(dataset, flight_class, bin_width):
+    # Tab 3: average price per airline and booking-window bin for one class
+    cube = dataset.cube
+    where = {} if flight_class == "All Classes" else {"class": flight_class}
+
+    # ----------------------------
+    # AVERAGE PRICE PER AIRLINE × BIN, FROM THE AGGREGATE CUBE
+    # ----------------------------
+    avg_price_by_bin = (
+        cube.rollup(["airline", "days_bin"], where=where, days_bin=bin_width)
+        .rename(columns={"days_bin": "Days_Bin", "mean": "price"})
+    )
+
+    # ----------------------------
+    # PLOTLY MULTILINE CHART
+    # ----------------------------
+    fig = px.line(
+        avg_price_by_bin,
+        x="Days_Bin",
+        y="price",
+        color="airline",
+        markers=True,
+        title=(
+            f"Average Ticket Price Trend Across Airlines ({flight_class})"
+            if flight_class != "All Classes"
+            else "Average Ticket Price Trend Across Airlines (All Classes)"
+        )
+    )
+
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
+
+    fig.update_layout(
+        xaxis_title=f"Days Left ({bin_width}-Day Bins)",
+        yaxis_title="Average Ticket Price",
+        xaxis_tickangle=45,
+        legend_title="Airline"
+    )
+
+    # clearer axis lines
+    fig.update_xaxes(showline=True, linewidth=2)
+    fig.update_yaxes(showline=True, linewidth=2)
+
+    return fig, avg_price_by_bin
+
+
+def warm_up(dataset):
+    # Every tab for every class, at the default bin width
+    airline_class_bar(dataset)
+    stops_class_bar(dataset)
+    for flight_class in sorted(dataset.cube.values("class")):
+        airline_trend(dataset, flight_class, DEFAULT_BIN_WIDTH)
+
+
+def render(dataset):
+    cube = dataset.cube
+
+    # ===============================
+    # 1️⃣ STYLE THE RESEARCH QUESTION HEADER
+    # ===============================
+    st.markdown(RQ_STYLE, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 2️⃣ HEADER BLOCK (Fix: ensure no stray characters)
+    # ===============================
+    st.markdown("""
+        <div class='rq-header'>
+            <div class='rq-number'>5</div>
+            How do airline, class, and number of stops interact with the booking window (days left) in determining flight ticket prices?
+        </div>
+    """, unsafe_allow_html=True)
+
+
+    # ===============================
+    # 3️⃣ FIXED HYPOTHESIS DISPLAY
+    # ===============================
+    st.markdown("""
+        <div class="hyp-card">
+            <div class="hyp-title">Hypothesis</div>
+            <p>The impact of days left on ticket prices is jointly influenced by airline, flight class, and number of stops, leading to complex variations in pricing patterns.</p>
+            <div class="hyp-status">
+                <span class="hyp-status-icon">✔️</span>
+                Hypothesis Supported
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Only the open tab is computed; the others run once they are selected
+    tab1, tab2, tab3 = st.tabs([
+        "Airline vs Class Pricing Comparison",
+        "Pricing Differences by Stops and Class",
+        "Booking Window Price Trend Across Airlines"
+    ], key="rq5_tabs", on_change="rerun")
+
+
+    if tab1.open:
+        with tab1:
+
+            st.subheader("Average Ticket Price by Airline and Flight Class")
+
+            fig, avg_price_airline_class = airline_class_bar(dataset)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(dataset, "rq5_tab1", table=avg_price_airline_class)
+
+    if tab2.open:
+        with tab2:
+
+            st.subheader("Average Ticket Price by Number of Stops and Flight Class")
+
+            fig, avg_price_stops_class = stops_class_bar(dataset)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(dataset, "rq5_tab2", table=avg_price_stops_class)
+
+    if tab3.open:
+        with tab3:
+
+            st.subheader("Booking Window Price Trend Across Airlines")
+
+            # ----------------------------
+            # CLASS DROPDOWN
+            # ----------------------------
+            class_options =  sorted(cube.values("class"))
+            selected_class = st.selectbox(
+                "Select Flight Class:",
+                class_options,
+                index=0, 
+                key="rq5_tab3_class"
+            )
+
+            # Filter based on dropdown
+            where = {}
+            if selected_class != "All Classes":
+                where["class"] = selected_class
+
+            bin_width = bin_width_slider("rq5_tab3_bin_width")
+
+            fig, avg_price_by_bin = airline_trend(dataset, selected_class, bin_width)
+
+            plotly_chart(fig, use_container_width=True)
+
+            export_controls(dataset, "rq5_tab3", where=where, table=avg_price_by_bin)
+
+    st.markdown("""
+    **Insight:**
+
+    - **Ticket prices start highest when only a few days are left** (0–5 days), and drop sharply as the booking window widens.
+    - After around **15–20 days before departure**, prices stabilize for most airlines.
+    - **Airline pricing strategies differ noticeably**:
+    - Premium airlines like **Vistara** and **Air India** remain consistently more expensive across all booking windows.
+    - Budget carriers such as **AirAsia** and **GO_FIRST** offer the lowest prices throughout.
+    - The curves show that some airlines reduce prices more aggressively as the departure date gets farther away, while others show more gradual changes.
+    - When multiple classes are included, the lines reflect the **combined influence of Economy and Business**, leading to greater variation due to class mix.
+
+    """)
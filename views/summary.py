@@ -0,0 +1,45 @@
+"""Summary page: overall findings and conclusion."""
+import streamlit as st
+
+
+def render(dataset):
+    st.header("📘 Summary & Key Insights")
+
+    st.markdown("""
+    ### **Overall Findings**
+
+    - **Airline choice strongly influences ticket prices.**  
+    Premium airlines like Vistara and Air India consistently charge much higher fares, especially for Business class.
+
+    - **Business class prices vary dramatically across airlines.**  
+    Some airlines charge 5–7× more for Business class, while others have smaller class gaps.
+
+    - **Non-stop flights are the cheapest overall**, while **1-stop and 2+ stop flights tend to be more expensive**, especially for Business class.
+
+    - **Price behavior changes as the departure date approaches.**  
+    All airlines show higher prices when booked last-minute, with large drops between 0–10 days left and stabilization after ~20 days.
+
+    - **Price sensitivity to booking window differs by airline.**  
+    Some airlines show sharp price drops as days_left increases, while others maintain stable pricing.
+
+    - **Stops and Class interact in complex ways.**  
+    Multi-stop Business flights are often the most expensive because they correspond to longer, higher-end routes.
+
+    - **Airline, Class, and Stops jointly shape pricing patterns**, confirming that price is not determined by a single factor but by the interaction of multiple ones.
+
+    ---
+
+    ### **Conclusion**
+
+    Across RQ1–RQ5, the results show that:
+
+    - Some hypotheses (RQ1, RQ2, RQ3, RQ5) were **supported**,  
+    - while others (such as RQ4) were **not supported**,  
+    revealing unexpected patterns in stop-based pricing.
+
+    Overall, the analyses demonstrate that **airline pricing is shaped by interconnected factors** —  
+    **airline strategy, number of stops, travel class, and the booking window**.  
+
+    These insights can help travelers make better booking decisions  
+    and enable airlines to understand competitor pricing dynamics.
+    """)
@@ -0,0 +1,59 @@
+"""Background warm-up of the dataset and every page's default figures.
+
+``start()`` runs ``warm_up()`` once per process in a daemon thread and sets
+``ready`` when it is done, so ``server.py`` can report the app as ready only
+once the first visitor no longer pays for loading the data or building the
+default charts. Both fill the caches shared by all sessions
+(``flights_dataset()`` and ``figure_cache()``), so sessions that arrive
+during the warm-up still work; they just build what is not cached yet.
+"""
+import importlib
+import logging
+import threading
+import time
+
+from views.common import figure_cache, flights_dataset
+
+logger = logging.getLogger(__name__)
+
+# Page modules in views/ with a warm_up(dataset) function, in warm-up order
+PAGES = ("overview", "rq1", "rq2", "rq3", "rq4", "rq5")
+
+# Set once the warm-up has finished, whether or not it succeeded
+ready = threading.Event()
+
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def warm_up():
+    """Load the dataset and build each page's figures for its default widgets."""
+    start = time.perf_counter()
+    dataset = flights_dataset()
+    logger.info("Loaded %d flights in %.1f s", len(dataset.frame), time.perf_counter() - start)
+    for name in PAGES:
+        importlib.import_module(f"views.{name}").warm_up(dataset)
+    logger.info(
+        "Warm-up done in %.1f s: %s", time.perf_counter() - start, figure_cache().stats()
+    )
+
+
+def _run():
+    try:
+        warm_up()
+    except Exception:
+        # Pages build anything the warm-up missed on first view, and a failed
+        # data load shows its error there too; holding traffic forever helps no one
+        logger.exception("Warm-up failed")
+    finally:
+        ready.set()
+
+
+def start():
+    """Start the warm-up thread unless it already ran in this process."""
+    global _thread
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, name="warm-up", daemon=True)
+            _thread.start()
+    return _thread